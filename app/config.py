@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
+    # Password Hashing
+    bcrypt_rounds: int = 0  # 0 = calibrate at startup
+    bcrypt_target_ms: int = 250
+    
     # Cloudinary
     cloudinary_cloud_name: str
     cloudinary_api_key: str
@@ -69,7 +73,7 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Cached settings instance.
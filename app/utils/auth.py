@@ -3,9 +3,16 @@ Authentication Utilities
 JWT token handling and password hashing
 """
 
+import base64
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
+import bcrypt
+import msgspec
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -18,10 +25,79 @@ from app.schemas.user import TokenData
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Bounds for calibrated bcrypt cost
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+
+class TokenHeader(msgspec.Struct):
+    """JOSE header of an incoming token"""
+    alg: str
+
+
+class TokenClaims(msgspec.Struct):
+    """Claims issued by create_access_token"""
+    sub: Optional[str] = None
+    email: Optional[str] = None
+    role: Optional[str] = None
+    exp: Optional[int] = None
+    nbf: Optional[int] = None
+
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+def calibrate_bcrypt_rounds(target_ms: int) -> int:
+    """
+    Find the lowest bcrypt cost that takes at least target_ms on this CPU.
+    
+    Each extra round doubles the hashing time, so the search walks up
+    from the minimum cost and stops at the first one over budget.
+    """
+    rounds = BCRYPT_MIN_ROUNDS
+    
+    while rounds < BCRYPT_MAX_ROUNDS:
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=rounds))
+        
+        if (time.perf_counter() - start) * 1000 >= target_ms:
+            break
+        rounds += 1
+    
+    return rounds
+
+
+def configure_password_hashing() -> int:
+    """
+    Apply the bcrypt cost to the password context.
+    Calibrates the cost first if none is configured.
+    
+    Existing hashes keep verifying since each one stores its own cost.
+    
+    Returns:
+        The bcrypt rounds in use
+    """
+    settings = get_settings()
+    
+    if not settings.bcrypt_rounds:
+        settings.bcrypt_rounds = calibrate_bcrypt_rounds(settings.bcrypt_target_ms)
+    
+    pwd_context.update(bcrypt__rounds=settings.bcrypt_rounds)
+    
+    return settings.bcrypt_rounds
+
+
+@lru_cache(maxsize=4)
+def _signing_key(secret: str, algorithm: str):
+    """
+    Parse the JWT secret into a jose key object once.
+    
+    jose passes Key instances through as-is, so reusing one skips
+    re-deriving the key on every encode and decode.
+    """
+    return jwk.construct(secret, algorithm)
+
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
     return pwd_context.hash(password)
@@ -56,13 +132,52 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
+        _signing_key(settings.jwt_secret_key, settings.jwt_algorithm),
         algorithm=settings.jwt_algorithm
     )
     
     return encoded_jwt
 
 
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment"""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hs256(token: str, secret: str) -> Optional[TokenClaims]:
+    """
+    Verify an HS256 token and decode its claims straight into TokenClaims.
+    
+    Returns:
+        TokenClaims if the signature and time claims are valid, None otherwise
+    """
+    try:
+        signing_input, signature = token.rsplit(".", 1)
+        header_segment, payload_segment = signing_input.split(".")
+        
+        header = msgspec.json.decode(_b64url_decode(header_segment), type=TokenHeader)
+        if header.alg != "HS256":
+            return None
+        
+        expected = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+        
+        claims = msgspec.json.decode(_b64url_decode(payload_segment), type=TokenClaims)
+        
+    except (ValueError, msgspec.DecodeError):
+        return None
+    
+    now = time.time()
+    
+    if claims.exp is not None and claims.exp < now:
+        return None
+    if claims.nbf is not None and claims.nbf > now:
+        return None
+    
+    return claims
+
+
 def decode_token(token: str) -> Optional[TokenData]:
     """
     Decode and validate a JWT token.
@@ -75,10 +190,19 @@ def decode_token(token: str) -> Optional[TokenData]:
     """
     settings = get_settings()
     
+    # Fast path for the default algorithm; python-jose handles the rest
+    if settings.jwt_algorithm == "HS256":
+        claims = _decode_hs256(token, settings.jwt_secret_key)
+        
+        if claims is None or claims.sub is None:
+            return None
+        
+        return TokenData(user_id=claims.sub, email=claims.email, role=claims.role)
+    
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
+            _signing_key(settings.jwt_secret_key, settings.jwt_algorithm),
             algorithms=[settings.jwt_algorithm]
         )
         
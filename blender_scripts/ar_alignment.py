@@ -75,8 +75,8 @@ class ARAligner:
         """Load the 3D model file"""
         ext = os.path.splitext(self.filepath)[1].lower()
         
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
+        # Clear existing objects in one batch (no selection pass)
+        bpy.data.batch_remove(list(bpy.data.objects))
         
         if ext == ".blend":
             bpy.ops.wm.open_mainfile(filepath=self.filepath)
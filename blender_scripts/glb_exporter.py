@@ -14,6 +14,8 @@ Usage:
 
 import sys
 import os
+import json
+import struct
 
 try:
     import bpy
@@ -22,6 +24,69 @@ except ImportError:
     IN_BLENDER = False
 
 
+# GLB container constants (glTF 2.0 binary format)
+GLB_MAGIC = b"glTF"
+GLB_CHUNK_JSON = 0x4E4F534A
+
+# Primitive modes: 4 = TRIANGLES, 5 = TRIANGLE_STRIP, 6 = TRIANGLE_FAN
+TRIANGLE_MODES = (4, 5, 6)
+
+
+def read_glb_stats(glb_path: str) -> dict:
+    """
+    Read mesh and polygon counts from a GLB without importing it.
+    
+    Accessors in the JSON chunk declare their element counts, so the
+    triangle count can be derived without decoding any geometry.
+    
+    Args:
+        glb_path: Path to GLB file
+    
+    Returns:
+        Dictionary with mesh_count, mesh_instance_count and polygon_count,
+        defined as in ModelValidator
+    """
+    with open(glb_path, "rb") as f:
+        magic, _version, _length = struct.unpack("<4sII", f.read(12))
+        if magic != GLB_MAGIC:
+            raise ValueError("Not a GLB file")
+        
+        chunk_length, chunk_type = struct.unpack("<II", f.read(8))
+        if chunk_type != GLB_CHUNK_JSON:
+            raise ValueError("GLB is missing its JSON chunk")
+        
+        gltf = json.loads(f.read(chunk_length))
+    
+    accessors = gltf.get("accessors", [])
+    meshes = gltf.get("meshes", [])
+    
+    mesh_polys = []
+    for mesh in meshes:
+        polys = 0
+        for prim in mesh.get("primitives", []):
+            mode = prim.get("mode", 4)
+            if mode not in TRIANGLE_MODES:
+                continue
+            
+            if "indices" in prim:
+                count = accessors[prim["indices"]]["count"]
+            else:
+                count = accessors[prim["attributes"]["POSITION"]]["count"]
+            
+            polys += count // 3 if mode == 4 else max(count - 2, 0)
+        mesh_polys.append(polys)
+    
+    # Nodes are mesh instances; each referenced mesh counts once
+    mesh_nodes = [n["mesh"] for n in gltf.get("nodes", []) if "mesh" in n]
+    used_meshes = set(mesh_nodes)
+    
+    return {
+        "mesh_count": len(used_meshes),
+        "mesh_instance_count": len(mesh_nodes),
+        "polygon_count": sum(mesh_polys[m] for m in used_meshes)
+    }
+
+
 class GLBExporter:
     """Exports GLB files optimized for WebAR"""
     
@@ -108,8 +173,8 @@ class GLBExporter:
         """Load the 3D model file"""
         ext = os.path.splitext(self.filepath)[1].lower()
         
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
+        # Clear existing objects in one batch (no selection pass)
+        bpy.data.batch_remove(list(bpy.data.objects))
         
         if ext == ".blend":
             bpy.ops.wm.open_mainfile(filepath=self.filepath)
@@ -185,14 +250,13 @@ class GLBExporter:
         elif file_size > 5 * 1024 * 1024:
             warnings.append(f"File size ({file_size / 1024 / 1024:.1f}MB) is large for mobile")
         
-        # Load and check
+        # Read counts straight from the GLB JSON chunk (no scene import)
         try:
-            bpy.ops.object.select_all(action='SELECT')
-            bpy.ops.object.delete()
-            bpy.ops.import_scene.gltf(filepath=glb_path)
+            glb_stats = read_glb_stats(glb_path)
             
-            mesh_count = len([o for o in bpy.data.objects if o.type == 'MESH'])
-            total_polys = sum(len(o.data.polygons) for o in bpy.data.objects if o.type == 'MESH')
+            mesh_count = glb_stats["mesh_count"]
+            mesh_instance_count = glb_stats["mesh_instance_count"]
+            total_polys = glb_stats["polygon_count"]
             
             if total_polys > 100000:
                 warnings.append(f"High polygon count: {total_polys}")
@@ -204,6 +268,7 @@ class GLBExporter:
                 "stats": {
                     "file_size": file_size,
                     "mesh_count": mesh_count,
+                    "mesh_instance_count": mesh_instance_count,
                     "polygon_count": total_polys
                 }
             }
@@ -228,6 +293,23 @@ def export_glb(
     return exporter.export(output_path, use_draco, draco_level)
 
 
+def validate_glb_files(glb_paths: list) -> dict:
+    """
+    Validate many GLB files.
+    
+    Validation only reads each file's JSON chunk, so the files are
+    checked in turn; worker processes would cost more than the work.
+    
+    Args:
+        glb_paths: Paths to GLB files
+    
+    Returns:
+        Dictionary mapping each path to its validation results
+    """
+    validator = GLBExporter()
+    return {path: validator.validate(path) for path in glb_paths}
+
+
 if __name__ == "__main__" and IN_BLENDER:
     import argparse
     
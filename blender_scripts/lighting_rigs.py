@@ -23,8 +23,12 @@ except ImportError:
     IN_BLENDER = False
 
 
+# Light datablocks keyed by their settings, reused across rig setups
+_LIGHT_CACHE = {}
+
+
 def clear_lights():
-    """Remove all existing lights"""
+    """Remove all existing light objects (light datablocks stay cached)"""
     if not IN_BLENDER:
         return
     
@@ -32,6 +36,38 @@ def clear_lights():
         bpy.data.objects.remove(light)
 
 
+def _get_light_data(
+    name: str,
+    light_type: str,
+    energy: float,
+    color: tuple,
+    size: float
+) -> bpy.types.Light:
+    """Return a cached light datablock for these settings, creating it if needed"""
+    key = (name, light_type, energy, tuple(color), size)
+    
+    light_data = _LIGHT_CACHE.get(key)
+    if light_data is not None:
+        try:
+            light_data.name  # Raises if the datablock was removed from bpy.data
+            return light_data
+        except ReferenceError:
+            pass
+    
+    light_data = bpy.data.lights.new(name=name, type=light_type)
+    light_data.energy = energy
+    light_data.color = color
+    
+    if light_type == 'AREA':
+        light_data.size = size
+    elif light_type == 'SPOT':
+        light_data.spot_size = math.radians(45)
+        light_data.spot_blend = 0.5
+    
+    _LIGHT_CACHE[key] = light_data
+    return light_data
+
+
 def create_light(
     name: str,
     light_type: str,
@@ -45,15 +81,7 @@ def create_light(
     if not IN_BLENDER:
         return None
     
-    light_data = bpy.data.lights.new(name=name, type=light_type)
-    light_data.energy = energy
-    light_data.color = color
-    
-    if light_type == 'AREA':
-        light_data.size = size
-    elif light_type == 'SPOT':
-        light_data.spot_size = math.radians(45)
-        light_data.spot_blend = 0.5
+    light_data = _get_light_data(name, light_type, energy, color, size)
     
     light_obj = bpy.data.objects.new(name=name, object_data=light_data)
     bpy.context.collection.objects.link(light_obj)
@@ -194,14 +222,15 @@ def setup_gem_sparkle():
         (0.5, -2.5, 1.5),
     ]
     
+    # All sparkles share one point light - only the object transforms differ
+    sparkle_data = _get_light_data("Sparkle", 'POINT', 50, (1.0, 1.0, 1.0), 1.0)
+    
+    collection = bpy.context.collection
+    
     for i, pos in enumerate(sparkle_positions):
-        create_light(
-            name=f"Sparkle_{i+1}",
-            light_type="POINT",
-            location=pos,
-            energy=50,
-            color=(1.0, 1.0, 1.0)
-        )
+        light_obj = bpy.data.objects.new(name=f"Sparkle_{i+1}", object_data=sparkle_data)
+        light_obj.location = pos
+        collection.objects.link(light_obj)
 
 
 def setup_gold_realism():
@@ -21,7 +21,8 @@ import os
 try:
     import bpy
     import bmesh
-    from mathutils import Vector
+    import numpy as np
+    from mathutils import Matrix, Vector
     IN_BLENDER = True
 except ImportError:
     IN_BLENDER = False
@@ -30,6 +31,9 @@ except ImportError:
 class ModelCleaner:
     """Cleans 3D models for AR jewellery pipeline"""
     
+    MERGE_DISTANCE = 0.0001
+    GRID_MERGE_MIN_VERTS = 50000  # Use the grid merge above this size
+    
     def __init__(self, filepath: str = None):
         self.filepath = filepath
         self.log = []
@@ -50,9 +54,7 @@ class ModelCleaner:
         # Run cleaning operations
         self._remove_unused_data()
         self._delete_hidden_objects()
-        self._merge_duplicate_vertices()
-        self._apply_transforms()
-        self._recalculate_normals()
+        self._clean_mesh_pipeline()
         self._fix_shading()
         self._set_origin_to_center()
         self._enforce_unit_system()
@@ -67,8 +69,8 @@ class ModelCleaner:
         """Load the 3D model file"""
         ext = os.path.splitext(self.filepath)[1].lower()
         
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
+        # Clear existing objects in one batch (no selection pass)
+        bpy.data.batch_remove(list(bpy.data.objects))
         
         if ext == ".blend":
             bpy.ops.wm.open_mainfile(filepath=self.filepath)
@@ -83,20 +85,30 @@ class ModelCleaner:
     
     def _remove_unused_data(self):
         """Remove unused datablocks"""
+        try:
+            # One recursive sweep over every orphaned datablock
+            bpy.ops.outliner.orphans_purge(
+                do_local_ids=True,
+                do_linked_ids=False,
+                do_recursive=True
+            )
+            self.log.append("Purged orphan data blocks")
+            return
+        except (AttributeError, RuntimeError, TypeError):
+            # Older Blender without the recursive purge operator
+            pass
+        
         # Remove unused meshes
-        for mesh in bpy.data.meshes:
-            if mesh.users == 0:
-                bpy.data.meshes.remove(mesh)
+        for mesh in [m for m in bpy.data.meshes if m.users == 0]:
+            bpy.data.meshes.remove(mesh)
         
         # Remove unused materials
-        for mat in bpy.data.materials:
-            if mat.users == 0:
-                bpy.data.materials.remove(mat)
+        for mat in [m for m in bpy.data.materials if m.users == 0]:
+            bpy.data.materials.remove(mat)
         
         # Remove unused images
-        for img in bpy.data.images:
-            if img.users == 0:
-                bpy.data.images.remove(img)
+        for img in [i for i in bpy.data.images if i.users == 0]:
+            bpy.data.images.remove(img)
         
         self.log.append("Removed unused data blocks")
     
@@ -105,14 +117,15 @@ class ModelCleaner:
         to_delete = []
         
         for obj in bpy.data.objects:
-            # Delete if hidden in viewport
-            if obj.hide_viewport or obj.hide_get():
+            # Keep only mesh objects for AR (remove cameras, lights, etc.)
+            # Checked first since the type test is cheaper than hide_get()
+            if obj.type not in ('MESH', 'EMPTY'):
                 to_delete.append(obj)
             # Delete empty mesh objects
             elif obj.type == 'MESH' and len(obj.data.vertices) == 0:
                 to_delete.append(obj)
-            # Keep only mesh objects for AR (remove cameras, lights, etc.)
-            elif obj.type not in ['MESH', 'EMPTY']:
+            # Delete if hidden in viewport
+            elif obj.hide_viewport or obj.hide_get():
                 to_delete.append(obj)
         
         for obj in to_delete:
@@ -120,54 +133,197 @@ class ModelCleaner:
         
         self.log.append(f"Deleted {len(to_delete)} hidden/empty objects")
     
-    def _merge_duplicate_vertices(self):
-        """Merge duplicate vertices in all meshes"""
-        merged_count = 0
+    def _clean_mesh_pipeline(self):
+        """
+        Merge duplicate vertices, recalculate normals and apply transforms
+        in a single pass per mesh. Mesh edits go through bmesh directly,
+        so no mode switches or edit-mode operators are needed.
+        """
+        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        merged_verts = 0
         
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                
-                # Merge by distance (0.0001 units)
-                bpy.ops.mesh.remove_doubles(threshold=0.0001)
-                
-                bpy.ops.object.mode_set(mode='OBJECT')
-                merged_count += 1
+        for obj in meshes:
+            me = obj.data
+            
+            bm = bmesh.new()
+            bm.from_mesh(me)
+            
+            # Merge by distance (0.0001 units)
+            verts_before = len(bm.verts)
+            if verts_before > self.GRID_MERGE_MIN_VERTS:
+                self._merge_by_distance_grid(me, bm)
+            else:
+                bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=self.MERGE_DISTANCE)
+            merged_verts += verts_before - len(bm.verts)
+            
+            bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+            
+            bm.to_mesh(me)
+            me.update()
+            bm.free()
+            
+            # Already baked to world space - applying would rewrite every vertex for nothing
+            if self._has_identity_transform(obj):
+                continue
+            
+            bpy.context.view_layer.objects.active = obj
+            obj.select_set(True)
+            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+            obj.select_set(False)
         
-        self.log.append(f"Merged duplicate vertices in {merged_count} meshes")
+        self.log.append(f"Merged {merged_verts} duplicate vertices in {len(meshes)} meshes")
+        self.log.append("Applied all transforms")
+        self.log.append("Recalculated normals")
     
-    def _apply_transforms(self):
-        """Apply all transforms (location, rotation, scale)"""
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                obj.select_set(True)
-                bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-                obj.select_set(False)
+    @staticmethod
+    def _has_identity_transform(obj) -> bool:
+        """Check whether an object's basis matrix (including deltas and any rotation mode) is identity"""
+        basis = obj.matrix_basis
+        identity = Matrix.Identity(4)
         
-        self.log.append("Applied all transforms")
+        return all(
+            abs(basis[row][col] - identity[row][col]) < 1e-6
+            for row in range(4) for col in range(4)
+        )
     
-    def _recalculate_normals(self):
-        """Recalculate normals for all meshes"""
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.mesh.normals_make_consistent(inside=False)
-                bpy.ops.object.mode_set(mode='OBJECT')
+    def _merge_by_distance_grid(self, me, bm):
+        """
+        Merge vertices closer than MERGE_DISTANCE on a quantized grid.
         
-        self.log.append("Recalculated normals")
+        Coordinates are floored to MERGE_DISTANCE cells, so any two
+        vertices within MERGE_DISTANCE share a cell or are in one of its 26
+        neighbours. Candidate pairs come from those cells only, and each
+        vertex is welded onto the lowest-index kept vertex within
+        MERGE_DISTANCE. Kept vertices never move, so no vertex moves further
+        than remove_doubles would move it.
+        """
+        n = len(me.vertices)
+        co = np.empty(n * 3, dtype=np.float32)
+        me.vertices.foreach_get("co", co)
+        
+        targets = self._grid_merge_targets(co.reshape(n, 3), self.MERGE_DISTANCE)
+        if targets is None:
+            # Grid too large to key in int64
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=self.MERGE_DISTANCE)
+            return
+        
+        merge = np.nonzero(targets != np.arange(n))[0]
+        
+        bm.verts.ensure_lookup_table()
+        targetmap = {bm.verts[i]: bm.verts[t] for i, t in zip(merge.tolist(), targets[merge].tolist())}
+        
+        if targetmap:
+            bmesh.ops.weld_verts(bm, targetmap=targetmap)
+    
+    @staticmethod
+    def _grid_merge_targets(co, dist: float):
+        """
+        Weld target of every vertex (itself if kept).
+        
+        Args:
+            co: (n, 3) vertex coordinates
+            dist: Merge distance
+        
+        Returns:
+            Array of target vertex indices, or None if the grid is too large
+        """
+        n = len(co)
+        q = np.floor(co / dist).astype(np.int64)
+        
+        # Dense per-axis ranks keep the cell key small; a neighbour cell's
+        # rank is the vertex's rank +-1 when that coordinate exists at all
+        axes, ranks = zip(*(np.unique(q[:, axis], return_inverse=True) for axis in range(3)))
+        dims = np.array([len(u) for u in axes], dtype=np.int64)
+        if int(dims[0]) * int(dims[1]) * int(dims[2]) >= 2 ** 62:
+            return None
+        
+        ranks = np.stack([r.reshape(-1) for r in ranks], axis=1)
+        strides = np.array([dims[1] * dims[2], dims[2], 1], dtype=np.int64)
+        keys = ranks @ strides
+        
+        # Work in cell order so the neighbour lookups below are sorted queries
+        order = np.argsort(keys, kind="stable")
+        keys, ranks, q, co_sorted = keys[order], ranks[order], q[order], co[order]
+        
+        # Own cell plus one of each opposite pair of the 26 neighbours
+        offsets = [
+            (dx, dy, dz)
+            for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+            if (dx, dy, dz) >= (0, 0, 0)
+        ]
+        
+        lows, highs = [], []
+        for offset in offsets:
+            offset = np.array(offset, dtype=np.int64)
+            nranks = ranks + offset
+            valid = np.all((nranks >= 0) & (nranks < dims), axis=1)
+            for axis in range(3):
+                idx = np.clip(nranks[:, axis], 0, dims[axis] - 1)
+                valid &= axes[axis][idx] == q[:, axis] + offset[axis]
+            
+            src = np.nonzero(valid)[0]
+            nkeys = nranks[src] @ strides
+            lo = np.searchsorted(keys, nkeys, side="left")
+            counts = np.searchsorted(keys, nkeys, side="right") - lo
+            
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            
+            # Expand every vertex against all vertices of the neighbour cell
+            within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            a = np.repeat(src, counts)
+            b = np.repeat(lo, counts) + within
+            
+            keep = a < b if not offset.any() else a != b
+            a, b = a[keep], b[keep]
+            close = np.linalg.norm(co_sorted[a] - co_sorted[b], axis=1) <= dist
+            a, b = order[a[close]], order[b[close]]
+            lows.append(np.minimum(a, b))
+            highs.append(np.maximum(a, b))
+        
+        targets = np.arange(n)
+        if not lows:
+            return targets
+        
+        lo = np.concatenate(lows)
+        hi = np.concatenate(highs)
+        
+        # Greedy in index order: a vertex is kept unless a lower-index kept
+        # vertex is within dist, in which case it welds onto the lowest one
+        kept = np.ones(n, dtype=np.bool_)
+        kept[hi] = False
+        decided = kept.copy()
+        
+        while not decided.all():
+            # Vertices are resolved once all their lower neighbours are
+            blocked = np.zeros(n, dtype=np.bool_)
+            blocked[hi[~decided[lo]]] = True
+            ready = ~decided & ~blocked
+            
+            best = np.full(n, n)
+            pairs = kept[lo] & ready[hi]
+            np.minimum.at(best, hi[pairs], lo[pairs])
+            
+            welded = best < n
+            targets[welded] = best[welded]
+            kept |= ready & ~welded
+            decided |= ready
+        
+        return targets
     
     def _fix_shading(self):
         """Set smooth shading for all meshes"""
         for obj in bpy.data.objects:
             if obj.type == 'MESH':
-                # Set smooth shading
-                for poly in obj.data.polygons:
-                    poly.use_smooth = True
+                # Set smooth shading on every face in one bulk write,
+                # skipped when every face is already smooth
+                n = len(obj.data.polygons)
+                flags = np.empty(n, dtype=np.bool_)
+                obj.data.polygons.foreach_get("use_smooth", flags)
+                
+                if not flags.all():
+                    obj.data.polygons.foreach_set("use_smooth", np.ones(n, dtype=np.bool_))
                 
                 # Enable auto smooth for better normals
                 obj.data.use_auto_smooth = True
@@ -176,10 +332,12 @@ class ModelCleaner:
         self.log.append("Applied smooth shading with auto-smooth")
     
     def _set_origin_to_center(self):
-        """Set origin to center of geometry for all meshes"""
+        """
+        Set origin to center of geometry for all meshes.
+        Leaves every object selected; only selection-independent steps run after it.
+        """
         bpy.ops.object.select_all(action='SELECT')
         bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-        bpy.ops.object.select_all(action='DESELECT')
         
         self.log.append("Set origin to geometry center")
     
@@ -12,11 +12,12 @@ Usage (as module when Blender is available):
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Check if running in Blender
 try:
     import bpy
-    import bmesh
+    import numpy as np
     IN_BLENDER = True
 except ImportError:
     IN_BLENDER = False
@@ -31,11 +32,15 @@ class ModelValidator:
     MAX_TEXTURE_SIZE = 2048    # Max texture resolution
     RECOMMENDED_POLYGON_COUNT = 50000
     
-    def __init__(self, filepath: str = None):
+    def __init__(self, filepath: str = None, auto_fix: bool = False, fixed_path: str = None):
         self.filepath = filepath
+        self.auto_fix = auto_fix
+        self.fixed_path = fixed_path
+        self._fixed = []
         self.issues = []
         self.warnings = []
         self.stats = {}
+        self._mesh_scans = None
     
     def validate(self) -> dict:
         """
@@ -60,6 +65,9 @@ class ModelValidator:
         self._check_non_manifold()
         self._check_scale()
         
+        if self._fixed:
+            self._save_fixes()
+        
         return {
             "valid": len(self.issues) == 0,
             "polygon_count": self.stats.get("polygon_count", 0),
@@ -75,9 +83,8 @@ class ModelValidator:
         """Load the 3D model file"""
         ext = os.path.splitext(self.filepath)[1].lower()
         
-        # Clear existing objects
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
+        # Clear existing objects in one batch (no selection pass)
+        bpy.data.batch_remove(list(bpy.data.objects))
         
         if ext == ".blend":
             bpy.ops.wm.open_mainfile(filepath=self.filepath)
@@ -90,14 +97,13 @@ class ModelValidator:
     
     def _check_polygon_count(self):
         """Check total polygon count"""
-        total_polys = 0
-        
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                total_polys += len(obj.data.polygons)
+        # Count each mesh datablock once, however many objects instance it
+        meshes = [m for m in bpy.data.meshes if m.users > 0]
+        total_polys = sum(len(m.polygons) for m in meshes)
         
         self.stats["polygon_count"] = total_polys
-        self.stats["mesh_count"] = len([o for o in bpy.data.objects if o.type == 'MESH'])
+        self.stats["mesh_count"] = len(meshes)
+        self.stats["mesh_instance_count"] = sum(1 for o in bpy.data.objects if o.type == 'MESH')
         
         if total_polys > self.MAX_POLYGON_COUNT:
             self.issues.append(
@@ -113,12 +119,14 @@ class ModelValidator:
         has_uv = False
         missing_uv = []
         
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                if len(obj.data.uv_layers) > 0:
-                    has_uv = True
-                else:
-                    missing_uv.append(obj.name)
+        for mesh in bpy.data.meshes:
+            if mesh.users == 0:
+                continue
+            
+            if len(mesh.uv_layers) > 0:
+                has_uv = True
+            else:
+                missing_uv.append(mesh.name)
         
         self.stats["has_uv_maps"] = has_uv
         
@@ -130,12 +138,14 @@ class ModelValidator:
         has_materials = False
         no_material = []
         
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                if len(obj.data.materials) > 0:
-                    has_materials = True
-                else:
-                    no_material.append(obj.name)
+        for mesh in bpy.data.meshes:
+            if mesh.users == 0:
+                continue
+            
+            if len(mesh.materials) > 0:
+                has_materials = True
+            else:
+                no_material.append(mesh.name)
         
         self.stats["has_materials"] = has_materials
         self.stats["material_count"] = len(bpy.data.materials)
@@ -147,10 +157,23 @@ class ModelValidator:
         """Check texture resolutions"""
         max_size = 0
         oversized = []
+        downscaled = []
         
         for img in bpy.data.images:
             if img.size[0] > 0:
+                # Sizes are reported as found in the input file
                 size = max(img.size[0], img.size[1])
+                
+                if size > self.MAX_TEXTURE_SIZE and self.auto_fix:
+                    # Halve until within budget (keeps power-of-two textures power-of-two)
+                    width, height = img.size
+                    while max(width, height) > self.MAX_TEXTURE_SIZE:
+                        width, height = max(width // 2, 1), max(height // 2, 1)
+                    
+                    img.scale(width, height)
+                    self._fixed.append(img)
+                    downscaled.append(f"{img.name} ({size}px -> {max(width, height)}px)")
+                
                 max_size = max(max_size, size)
                 
                 if size > self.MAX_TEXTURE_SIZE:
@@ -161,54 +184,142 @@ class ModelValidator:
         
         if oversized:
             self.warnings.append(f"Large textures: {', '.join(oversized)}")
+        
+        if downscaled:
+            self.warnings.append(f"Downscaled textures: {', '.join(downscaled)}")
+    
+    def _save_fixes(self):
+        """
+        Pack the downscaled textures and save them to fixed_path.
+        Without a fixed_path the fixes only live in this Blender session.
+        """
+        for img in self._fixed:
+            # Scaled pixels exist only in memory until packed
+            img.pack()
+        
+        if self.fixed_path:
+            bpy.ops.wm.save_as_mainfile(filepath=self.fixed_path, copy=True)
+            self.stats["fixed_path"] = self.fixed_path
+        else:
+            self.warnings.append("Texture fixes not saved: no fixed_path given")
     
     def _check_normals(self):
         """Check for flipped normals"""
-        flipped_count = 0
-        
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                bm = bmesh.new()
-                bm.from_mesh(obj.data)
-                
-                # Check for inconsistent normals
-                for face in bm.faces:
-                    # Simple check - in production, use more sophisticated algorithm
-                    pass
-                
-                bm.free()
+        inconsistent = [
+            f"{name} ({flipped} edges)"
+            for name, _, flipped in self._scan_meshes()
+            if flipped
+        ]
         
         self.stats["normals_checked"] = True
+        
+        if inconsistent:
+            self.warnings.append(f"Inconsistent normals in: {', '.join(inconsistent)}")
     
     def _check_non_manifold(self):
         """Check for non-manifold geometry"""
-        non_manifold = []
-        
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                bm = bmesh.new()
-                bm.from_mesh(obj.data)
-                
-                # Find non-manifold edges
-                nm_edges = [e for e in bm.edges if not e.is_manifold]
-                
-                if nm_edges:
-                    non_manifold.append(f"{obj.name} ({len(nm_edges)} edges)")
-                
-                bm.free()
+        non_manifold = [
+            f"{name} ({nm_edges} edges)"
+            for name, nm_edges, _ in self._scan_meshes()
+            if nm_edges
+        ]
         
         if non_manifold:
             self.warnings.append(f"Non-manifold geometry in: {', '.join(non_manifold)}")
     
+    def _scan_meshes(self) -> list:
+        """
+        Gather per-mesh topology counts.
+        Mesh data is read with foreach_get on the main thread (bpy is not
+        thread-safe); only the NumPy counting runs in the thread pool.
+        
+        Returns:
+            List of (mesh name, non-manifold edges, inconsistent edges)
+        """
+        if self._mesh_scans is not None:
+            return self._mesh_scans
+        
+        topologies = [self._read_topology(m) for m in bpy.data.meshes if m.users > 0]
+        
+        if topologies:
+            with ThreadPoolExecutor(max_workers=min(8, len(topologies))) as pool:
+                self._mesh_scans = list(pool.map(self._scan_topology, topologies))
+        else:
+            self._mesh_scans = []
+        
+        return self._mesh_scans
+    
+    @staticmethod
+    def _read_topology(mesh) -> dict:
+        """Copy the loop and polygon arrays of a mesh into NumPy"""
+        n_loops = len(mesh.loops)
+        n_polys = len(mesh.polygons)
+        
+        topology = {
+            "name": mesh.name,
+            "n_edges": len(mesh.edges),
+            "n_verts": len(mesh.vertices),
+            "edge_idx": np.empty(n_loops, dtype=np.int64),
+            "vert_idx": np.empty(n_loops, dtype=np.int64),
+            "loop_start": np.empty(n_polys, dtype=np.int64),
+            "loop_total": np.empty(n_polys, dtype=np.int64),
+        }
+        mesh.loops.foreach_get("edge_index", topology["edge_idx"])
+        mesh.loops.foreach_get("vertex_index", topology["vert_idx"])
+        mesh.polygons.foreach_get("loop_start", topology["loop_start"])
+        mesh.polygons.foreach_get("loop_total", topology["loop_total"])
+        return topology
+    
+    @classmethod
+    def _scan_topology(cls, topology: dict) -> tuple:
+        """Topology counts of a single mesh, from its NumPy arrays only"""
+        return (
+            topology["name"],
+            cls._count_non_manifold_edges(topology),
+            cls._count_inconsistent_edges(topology)
+        )
+    
+    @staticmethod
+    def _count_non_manifold_edges(topology: dict) -> int:
+        """Count edges not shared by exactly two faces"""
+        face_counts = np.bincount(topology["edge_idx"], minlength=topology["n_edges"])
+        return int((face_counts != 2).sum())
+    
+    @staticmethod
+    def _count_inconsistent_edges(topology: dict) -> int:
+        """
+        Count edges whose adjacent faces wind in the same direction.
+        With consistent normals, neighbouring faces traverse a shared
+        edge in opposite directions, so each directed edge appears once.
+        """
+        vert_idx = topology["vert_idx"]
+        n_loops = len(vert_idx)
+        if n_loops == 0:
+            return 0
+        
+        loop_start = topology["loop_start"]
+        loop_total = topology["loop_total"]
+        
+        # Index of the next loop around each face
+        poly_of_loop = np.repeat(np.arange(len(loop_start)), loop_total)
+        start = loop_start[poly_of_loop]
+        next_loop = start + (np.arange(n_loops) - start + 1) % loop_total[poly_of_loop]
+        
+        directed = vert_idx * topology["n_verts"] + vert_idx[next_loop]
+        _, counts = np.unique(directed, return_counts=True)
+        return int((counts > 1).sum())
+    
     def _check_scale(self):
         """Check object scale consistency"""
-        wrong_scale = []
+        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        if not meshes:
+            return
         
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
-                scale = obj.scale
-                if not (0.99 < scale.x < 1.01 and 0.99 < scale.y < 1.01 and 0.99 < scale.z < 1.01):
-                    wrong_scale.append(obj.name)
+        # Compare every axis of every object in one vectorized pass
+        scales = np.array([tuple(obj.scale) for obj in meshes], dtype=np.float32)
+        unapplied = np.any(np.abs(scales - 1.0) >= 0.01, axis=1)
+        
+        wrong_scale = [meshes[i].name for i in np.nonzero(unapplied)[0]]
         
         if wrong_scale:
             self.warnings.append(f"Unapplied scale on: {', '.join(wrong_scale)}")
@@ -227,17 +338,19 @@ class ModelValidator:
         }
 
 
-def validate_model(filepath: str = None) -> dict:
+def validate_model(filepath: str = None, auto_fix: bool = False, fixed_path: str = None) -> dict:
     """
     Convenience function to validate a model.
     
     Args:
         filepath: Path to 3D model file
+        auto_fix: Downscale oversized textures instead of only warning
+        fixed_path: .blend path to save the fixed model to
     
     Returns:
         Validation results dictionary
     """
-    validator = ModelValidator(filepath)
+    validator = ModelValidator(filepath, auto_fix, fixed_path)
     return validator.validate()
 
 
@@ -255,11 +368,16 @@ if __name__ == "__main__" and IN_BLENDER:
     parser = argparse.ArgumentParser(description="Validate 3D model for AR")
     parser.add_argument("--input", required=True, help="Input model file")
     parser.add_argument("--output", help="Output JSON file for results")
+    parser.add_argument("--auto-fix", action="store_true", help="Downscale oversized textures")
+    parser.add_argument("--fixed-output", help="Output .blend file for the fixed model")
     
     args = parser.parse_args(argv)
     
+    if args.auto_fix and not args.fixed_output:
+        parser.error("--auto-fix requires --fixed-output")
+    
     # Run validation
-    result = validate_model(args.input)
+    result = validate_model(args.input, args.auto_fix, args.fixed_output)
     
     # Output results
     if args.output:
@@ -15,14 +15,27 @@ Usage:
 import sys
 import os
 import math
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import bpy
+    import numpy as np
     from mathutils import Vector
     IN_BLENDER = True
 except ImportError:
     IN_BLENDER = False
 
+if IN_BLENDER:
+    try:
+        from blender_scripts.lighting_rigs import setup_jewellery_lighting
+    except ImportError:
+        # Run directly via `blender -P renderer.py`: make the package importable
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from blender_scripts.lighting_rigs import setup_jewellery_lighting
+
 
 class JewelleryRenderer:
     """Renders jewellery preview images and animations"""
@@ -32,17 +45,37 @@ class JewelleryRenderer:
     TURNTABLE_SIZE = (720, 720)
     TURNTABLE_FRAMES = 36  # 10 degrees per frame
     
+    # Cycles GPU backends in order of preference
+    GPU_DEVICE_TYPES = ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI')
+    
+    # Preview shots: output name -> camera setup method
+    PREVIEW_SHOTS = {
+        "preview_front": "_setup_camera_front",
+        "preview_angle": "_setup_camera_angle",
+        "preview_detail": "_setup_camera_closeup",  # Gemstone close-up
+    }
+    
     def __init__(self, filepath: str = None):
         self.filepath = filepath
         self.log = []
+        self._world_coords = None
+        self._cached_center = None
+        self._cached_radius = None
+        self._camera = None
     
-    def render_previews(self, output_dir: str, use_cycles: bool = False) -> dict:
+    def render_previews(
+        self,
+        output_dir: str,
+        use_cycles: bool = False,
+        parallel: bool = False
+    ) -> dict:
         """
         Render preview images.
         
         Args:
             output_dir: Output directory for renders
             use_cycles: Use Cycles (slow but quality) vs Eevee (fast)
+            parallel: Render each shot in its own background Blender process
         
         Returns:
             Dictionary with render results
@@ -52,6 +85,7 @@ class JewelleryRenderer:
         
         if self.filepath:
             self._load_file()
+        self._cache_scene_bounds()
         
         os.makedirs(output_dir, exist_ok=True)
         
@@ -61,29 +95,18 @@ class JewelleryRenderer:
         # Setup transparent background
         self._setup_transparent_background()
         
-        # Import lighting
-        from blender_scripts.lighting_rigs import setup_jewellery_lighting
+        # Setup lighting
         setup_jewellery_lighting()
         
-        outputs = {}
-        
-        # Render front view
-        self._setup_camera_front()
-        front_path = os.path.join(output_dir, "preview_front.png")
-        self._render_frame(front_path)
-        outputs["preview_front"] = front_path
-        
-        # Render angled view
-        self._setup_camera_angle()
-        angle_path = os.path.join(output_dir, "preview_angle.png")
-        self._render_frame(angle_path)
-        outputs["preview_angle"] = angle_path
-        
-        # Render close-up (gemstone detail)
-        self._setup_camera_closeup()
-        detail_path = os.path.join(output_dir, "preview_detail.png")
-        self._render_frame(detail_path)
-        outputs["preview_detail"] = detail_path
+        if parallel:
+            outputs = self._render_shots_parallel(output_dir, use_cycles)
+        else:
+            outputs = {}
+            for shot, setup_camera in self.PREVIEW_SHOTS.items():
+                getattr(self, setup_camera)()
+                shot_path = os.path.join(output_dir, f"{shot}.png")
+                self._render_frame(shot_path)
+                outputs[shot] = shot_path
         
         return {
             "success": True,
@@ -91,13 +114,96 @@ class JewelleryRenderer:
             "log": self.log
         }
     
-    def render_turntable(self, output_path: str, use_cycles: bool = False) -> dict:
+    def render_shot(
+        self,
+        shot: str,
+        output_path: str,
+        use_cycles: bool = False,
+        gpu_index: int = None
+    ) -> dict:
+        """
+        Render a single preview shot of the currently open scene.
+        Entry point for the per-shot worker processes.
+        
+        Args:
+            shot: One of PREVIEW_SHOTS
+            output_path: Output image path
+            use_cycles: Scene renders with Cycles
+            gpu_index: Pin this process to one GPU
+        
+        Returns:
+            Dictionary with render results
+        """
+        if not IN_BLENDER:
+            return {"success": False, "error": "Not in Blender environment"}
+        
+        if use_cycles:
+            self._enable_worker_gpu(gpu_index)
+        
+        self._cache_scene_bounds()
+        getattr(self, self.PREVIEW_SHOTS[shot])()
+        self._render_frame(output_path)
+        
+        return {
+            "success": True,
+            "output": output_path,
+            "log": self.log
+        }
+    
+    def render_frames(
+        self,
+        output_pattern: str,
+        frame_start: int,
+        frame_end: int,
+        use_cycles: bool = False,
+        gpu_index: int = None
+    ) -> dict:
+        """
+        Render a frame range of the currently open scene as PNGs.
+        Entry point for the parallel turntable worker processes.
+        
+        Args:
+            output_pattern: Output path with #### for the frame number
+            frame_start: First frame to render
+            frame_end: Last frame to render
+            use_cycles: Scene renders with Cycles
+            gpu_index: Pin this process to one GPU
+        
+        Returns:
+            Dictionary with render results
+        """
+        if not IN_BLENDER:
+            return {"success": False, "error": "Not in Blender environment"}
+        
+        if use_cycles:
+            self._enable_worker_gpu(gpu_index)
+        
+        scene = bpy.context.scene
+        scene.frame_start = frame_start
+        scene.frame_end = frame_end
+        scene.render.image_settings.file_format = 'PNG'
+        scene.render.filepath = output_pattern
+        bpy.ops.render.render(animation=True)
+        
+        return {
+            "success": True,
+            "frames": frame_end - frame_start + 1,
+            "log": self.log
+        }
+    
+    def render_turntable(
+        self,
+        output_path: str,
+        use_cycles: bool = False,
+        parallel: bool = False
+    ) -> dict:
         """
         Render 360° turntable animation.
         
         Args:
             output_path: Output video/gif path
             use_cycles: Use Cycles for quality
+            parallel: Split frames across background Blender processes
         
         Returns:
             Dictionary with render results
@@ -107,13 +213,13 @@ class JewelleryRenderer:
         
         if self.filepath:
             self._load_file()
+        self._cache_scene_bounds()
         
         # Setup render settings for animation
         self._setup_render(use_cycles, resolution=self.TURNTABLE_SIZE)
         self._setup_transparent_background()
         
-        # Import lighting
-        from blender_scripts.lighting_rigs import setup_jewellery_lighting
+        # Setup lighting
         setup_jewellery_lighting()
         
         # Setup camera
@@ -122,14 +228,23 @@ class JewelleryRenderer:
         # Setup turntable animation
         self._setup_turntable_animation()
         
-        # Setup output format
-        bpy.context.scene.render.image_settings.file_format = 'FFMPEG'
-        bpy.context.scene.render.ffmpeg.format = 'MPEG4'
-        bpy.context.scene.render.ffmpeg.codec = 'H264'
-        bpy.context.scene.render.filepath = output_path
+        ffmpeg = shutil.which("ffmpeg")
+        workers = min(max(1, (os.cpu_count() or 1) // 2), self.TURNTABLE_FRAMES)
         
-        # Render animation
-        bpy.ops.render.render(animation=True)
+        if ffmpeg and parallel and workers > 1:
+            self._render_turntable_parallel(ffmpeg, output_path, workers, use_cycles)
+        elif ffmpeg:
+            # Encode in an external ffmpeg while the next frame renders
+            self._render_turntable_piped(ffmpeg, output_path)
+        else:
+            # Setup output format
+            bpy.context.scene.render.image_settings.file_format = 'FFMPEG'
+            bpy.context.scene.render.ffmpeg.format = 'MPEG4'
+            bpy.context.scene.render.ffmpeg.codec = 'H264'
+            bpy.context.scene.render.filepath = output_path
+            
+            # Render animation
+            bpy.ops.render.render(animation=True)
         
         return {
             "success": True,
@@ -142,9 +257,14 @@ class JewelleryRenderer:
         """Load the 3D model file"""
         ext = os.path.splitext(self.filepath)[1].lower()
         
-        # Keep only mesh objects when loading
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
+        # Scene bounds and camera no longer apply to the new model
+        self._world_coords = None
+        self._cached_center = None
+        self._cached_radius = None
+        self._camera = None
+        
+        # Clear existing objects in one batch (no selection pass)
+        bpy.data.batch_remove(list(bpy.data.objects))
         
         if ext == ".blend":
             bpy.ops.wm.open_mainfile(filepath=self.filepath)
@@ -159,8 +279,17 @@ class JewelleryRenderer:
         
         if use_cycles:
             scene.render.engine = 'CYCLES'
-            scene.cycles.samples = 128
+            
+            device_type = self._enable_cycles_gpu()
+            scene.cycles.device = 'GPU' if device_type else 'CPU'
+            
+            # Adaptive sampling stops converged pixels well before the cap
+            scene.cycles.samples = 512
+            scene.cycles.use_adaptive_sampling = True
+            scene.cycles.adaptive_threshold = 0.01
+            
             scene.cycles.use_denoising = True
+            scene.cycles.denoiser = 'OPTIX' if device_type == 'OPTIX' else 'OPENIMAGEDENOISE'
         else:
             scene.render.engine = 'BLENDER_EEVEE'
             scene.eevee.taa_render_samples = 64
@@ -171,43 +300,129 @@ class JewelleryRenderer:
         
         self.log.append(f"Setup render: {'Cycles' if use_cycles else 'Eevee'} at {resolution}")
     
+    def _enable_cycles_gpu(self, gpu_index: int = None) -> str:
+        """
+        Enable every GPU of the best available Cycles backend.
+        
+        Args:
+            gpu_index: Enable only this GPU (wraps around the device count)
+        
+        Returns:
+            Compute device type in use, or None to render on CPU
+        """
+        try:
+            prefs = bpy.context.preferences.addons['cycles'].preferences
+        except KeyError:
+            return None
+        
+        for device_type in self.GPU_DEVICE_TYPES:
+            try:
+                prefs.compute_device_type = device_type
+            except TypeError:
+                # Backend not compiled into this Blender build
+                continue
+            
+            prefs.get_devices()
+            gpus = [d for d in prefs.devices if d.type == device_type]
+            
+            if gpus:
+                for i, device in enumerate(gpus):
+                    device.use = gpu_index is None or i == gpu_index % len(gpus)
+                self.log.append(f"Cycles GPU: {device_type} ({len(gpus)} devices)")
+                return device_type
+        
+        prefs.compute_device_type = 'NONE'
+        return None
+    
+    def _enable_worker_gpu(self, gpu_index: int = None):
+        """Re-enable the Cycles GPU in a worker process"""
+        # GPU preferences are per process, not saved in the .blend
+        device_type = self._enable_cycles_gpu(gpu_index)
+        bpy.context.scene.cycles.device = 'GPU' if device_type else 'CPU'
+    
     def _setup_transparent_background(self):
         """Enable transparent background"""
         bpy.context.scene.render.film_transparent = True
         bpy.context.scene.render.image_settings.file_format = 'PNG'
         bpy.context.scene.render.image_settings.color_mode = 'RGBA'
     
+    def _get_world_coords(self) -> np.ndarray:
+        """
+        Get world-space vertex coordinates of all meshes as an (N, 3) array.
+        Vertices are read in bulk with foreach_get and cached per render.
+        """
+        if self._world_coords is not None:
+            return self._world_coords
+        
+        chunks = []
+        
+        for obj in bpy.data.objects:
+            if obj.type != 'MESH':
+                continue
+            
+            n = len(obj.data.vertices)
+            if n == 0:
+                continue
+            
+            buf = np.empty(n * 3, dtype=np.float32)
+            obj.data.vertices.foreach_get("co", buf)
+            co = buf.reshape(n, 3)
+            
+            matrix = np.array(obj.matrix_world, dtype=np.float32)
+            chunks.append(co @ matrix[:3, :3].T + matrix[:3, 3])
+        
+        self._world_coords = np.concatenate(chunks) if chunks else np.empty((0, 3), dtype=np.float32)
+        return self._world_coords
+    
+    def _cache_scene_bounds(self):
+        """Compute scene center and radius once for all camera setups"""
+        self._world_coords = None
+        self._cached_center = None
+        self._cached_radius = None
+        
+        self._cached_center = self._get_scene_center()
+        self._cached_radius = self._get_scene_radius()
+        
+        # Cameras only need the bounds, so release the vertex array
+        self._world_coords = None
+    
     def _get_scene_center(self) -> Vector:
-        """Get center of all mesh objects"""
-        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        """Get center of all mesh vertices"""
+        if self._cached_center is not None:
+            return self._cached_center
         
-        if not meshes:
-            return Vector((0, 0, 0))
+        coords = self._get_world_coords()
         
-        center = Vector((0, 0, 0))
-        for obj in meshes:
-            center += obj.location
-        center /= len(meshes)
+        if len(coords) == 0:
+            return Vector((0, 0, 0))
         
-        return center
+        return Vector(coords.mean(axis=0).tolist())
     
     def _get_scene_radius(self) -> float:
         """Get radius to encompass all objects"""
-        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        if self._cached_radius is not None:
+            return self._cached_radius
         
-        max_dist = 0
-        center = self._get_scene_center()
+        coords = self._get_world_coords()
+        
+        if len(coords) == 0:
+            return 1
         
-        for obj in meshes:
-            for v in obj.data.vertices:
-                world_co = obj.matrix_world @ v.co
-                dist = (world_co - center).length
-                max_dist = max(max_dist, dist)
+        center = np.array(self._get_scene_center(), dtype=np.float32)
+        max_dist = float(np.linalg.norm(coords - center, axis=1).max())
         
         return max_dist if max_dist > 0 else 1
     
-    def _create_camera(self) -> bpy.types.Object:
-        """Create and return camera"""
+    def _ensure_camera(self) -> bpy.types.Object:
+        """Return the render camera, creating it on first use"""
+        if self._camera is not None:
+            try:
+                if self._camera.name in bpy.data.objects:
+                    return self._camera
+            except ReferenceError:
+                # Camera was removed from the scene since it was cached
+                pass
+        
         # Remove existing cameras
         for cam in [o for o in bpy.data.objects if o.type == 'CAMERA']:
             bpy.data.objects.remove(cam)
@@ -218,11 +433,12 @@ class JewelleryRenderer:
         bpy.context.collection.objects.link(cam_obj)
         bpy.context.scene.camera = cam_obj
         
+        self._camera = cam_obj
         return cam_obj
     
     def _setup_camera_front(self):
         """Setup camera for front view"""
-        camera = self._create_camera()
+        camera = self._ensure_camera()
         center = self._get_scene_center()
         radius = self._get_scene_radius()
         
@@ -234,7 +450,7 @@ class JewelleryRenderer:
     
     def _setup_camera_angle(self):
         """Setup camera for 3/4 angle view"""
-        camera = self._create_camera()
+        camera = self._ensure_camera()
         center = self._get_scene_center()
         radius = self._get_scene_radius()
         
@@ -256,7 +472,7 @@ class JewelleryRenderer:
     
     def _setup_camera_closeup(self):
         """Setup camera for close-up detail view"""
-        camera = self._create_camera()
+        camera = self._ensure_camera()
         center = self._get_scene_center()
         radius = self._get_scene_radius()
         
@@ -298,6 +514,161 @@ class JewelleryRenderer:
         
         self.log.append(f"Setup turntable animation: {self.TURNTABLE_FRAMES} frames")
     
+    def _render_shots_parallel(self, output_dir: str, use_cycles: bool) -> dict:
+        """
+        Render every preview shot concurrently in background Blender processes.
+        
+        The prepared scene is saved once to a temporary .blend, and each
+        process renders one camera from it on its own GPU where available.
+        """
+        fd, scene_path = tempfile.mkstemp(suffix=".blend")
+        os.close(fd)
+        bpy.ops.wm.save_as_mainfile(filepath=scene_path, copy=True)
+        
+        def run_shot(index_shot: tuple) -> tuple:
+            index, shot = index_shot
+            shot_path = os.path.join(output_dir, f"{shot}.png")
+            
+            cmd = [
+                bpy.app.binary_path, "-b", scene_path, "--python-exit-code", "1",
+                "-P", os.path.abspath(__file__), "--",
+                "--shot", shot, "--output", shot_path, "--gpu-id", str(index)
+            ]
+            if use_cycles:
+                cmd.append("--cycles")
+            
+            self._run_worker(cmd, [shot_path])
+            return shot, shot_path
+        
+        try:
+            # Threads only wait on the Blender processes doing the rendering
+            with ThreadPoolExecutor(max_workers=len(self.PREVIEW_SHOTS)) as pool:
+                outputs = dict(pool.map(run_shot, enumerate(self.PREVIEW_SHOTS)))
+        finally:
+            os.remove(scene_path)
+        
+        for shot_path in outputs.values():
+            self.log.append(f"Rendered: {shot_path}")
+        
+        return outputs
+    
+    def _run_worker(self, cmd: list, expected_outputs: list):
+        """
+        Run a background Blender worker and check it wrote its outputs.
+        
+        Raises:
+            RuntimeError: With the worker's stderr if it failed or any
+                expected output file is missing
+        """
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        missing = [path for path in expected_outputs if not os.path.exists(path)]
+        
+        if result.returncode != 0 or missing:
+            reason = f"exited with code {result.returncode}" if result.returncode else f"did not write {missing}"
+            raise RuntimeError(f"Blender worker {reason}: {result.stderr.strip()}")
+    
+    def _render_turntable_parallel(self, ffmpeg: str, output_path: str, workers: int, use_cycles: bool):
+        """
+        Render turntable frame ranges in parallel background Blender
+        processes, then encode the PNG sequence with ffmpeg.
+        
+        Each process gets its own GPU where available and an equal share
+        of the CPU threads, so the workers don't oversubscribe the CPU.
+        """
+        scene = bpy.context.scene
+        frame_dir = tempfile.mkdtemp(prefix="turntable_")
+        scene_path = os.path.join(frame_dir, "scene.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=scene_path, copy=True)
+        
+        frames = list(range(scene.frame_start, scene.frame_end + 1))
+        chunk = math.ceil(len(frames) / workers)
+        ranges = [
+            (frames[i], frames[min(i + chunk, len(frames)) - 1])
+            for i in range(0, len(frames), chunk)
+        ]
+        
+        threads = max(1, (os.cpu_count() or 1) // len(ranges))
+        
+        def render_range(index: int, frame_range: tuple):
+            start, end = frame_range
+            cmd = [
+                bpy.app.binary_path, "-b", scene_path, "-t", str(threads), "--python-exit-code", "1",
+                "-P", os.path.abspath(__file__), "--",
+                "--frames", str(start), str(end),
+                "--output", os.path.join(frame_dir, "frame_####"), "--gpu-id", str(index)
+            ]
+            if use_cycles:
+                cmd.append("--cycles")
+            
+            frame_paths = [
+                os.path.join(frame_dir, f"frame_{frame:04d}.png")
+                for frame in range(start, end + 1)
+            ]
+            self._run_worker(cmd, frame_paths)
+        
+        try:
+            # Every frame must exist before encoding: ffmpeg's image2 demuxer
+            # stops at the first gap and would write a shortened video
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [pool.submit(render_range, i, r) for i, r in enumerate(ranges)]
+                for future in as_completed(futures):
+                    future.result()
+            
+            subprocess.run(
+                [
+                    ffmpeg, "-y", "-loglevel", "error",
+                    "-framerate", str(scene.render.fps), "-start_number", str(scene.frame_start),
+                    "-i", os.path.join(frame_dir, "frame_%04d.png"),
+                    "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p",
+                    output_path
+                ],
+                check=True
+            )
+        finally:
+            shutil.rmtree(frame_dir, ignore_errors=True)
+        
+        self.log.append(f"Rendered turntable in {len(ranges)} parallel processes: {output_path}")
+    
+    def _render_turntable_piped(self, ffmpeg: str, output_path: str):
+        """
+        Render turntable frames as PNGs and stream each one into ffmpeg.
+        
+        ffmpeg encodes frame N while Blender renders frame N+1, instead of
+        Blender encoding inline on its render thread.
+        """
+        scene = bpy.context.scene
+        frame_dir = tempfile.mkdtemp(prefix="turntable_")
+        
+        proc = subprocess.Popen(
+            [
+                ffmpeg, "-y", "-loglevel", "error",
+                "-f", "image2pipe", "-framerate", str(scene.render.fps), "-c:v", "png", "-i", "-",
+                "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p",
+                output_path
+            ],
+            stdin=subprocess.PIPE
+        )
+        
+        try:
+            for frame in range(scene.frame_start, scene.frame_end + 1):
+                scene.frame_set(frame)
+                frame_path = os.path.join(frame_dir, f"frame_{frame:04d}.png")
+                
+                scene.render.filepath = frame_path
+                bpy.ops.render.render(write_still=True)
+                
+                with open(frame_path, "rb") as f:
+                    proc.stdin.write(f.read())
+        finally:
+            proc.stdin.close()
+            proc.wait()
+            shutil.rmtree(frame_dir, ignore_errors=True)
+        
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {proc.returncode}")
+        
+        self.log.append(f"Encoded turntable with ffmpeg: {output_path}")
+    
     def _render_frame(self, output_path: str):
         """Render single frame"""
         bpy.context.scene.render.filepath = output_path
@@ -305,16 +676,26 @@ class JewelleryRenderer:
         self.log.append(f"Rendered: {output_path}")
 
 
-def render_previews(input_path: str, output_dir: str, use_cycles: bool = False) -> dict:
+def render_previews(
+    input_path: str,
+    output_dir: str,
+    use_cycles: bool = False,
+    parallel: bool = False
+) -> dict:
     """Convenience function to render previews"""
     renderer = JewelleryRenderer(input_path)
-    return renderer.render_previews(output_dir, use_cycles)
+    return renderer.render_previews(output_dir, use_cycles, parallel)
 
 
-def render_turntable(input_path: str, output_path: str, use_cycles: bool = False) -> dict:
+def render_turntable(
+    input_path: str,
+    output_path: str,
+    use_cycles: bool = False,
+    parallel: bool = False
+) -> dict:
     """Convenience function to render turntable"""
     renderer = JewelleryRenderer(input_path)
-    return renderer.render_turntable(output_path, use_cycles)
+    return renderer.render_turntable(output_path, use_cycles, parallel)
 
 
 if __name__ == "__main__" and IN_BLENDER:
@@ -327,20 +708,45 @@ if __name__ == "__main__" and IN_BLENDER:
         argv = []
     
     parser = argparse.ArgumentParser(description="Render jewellery previews")
-    parser.add_argument("--input", required=True, help="Input model file")
-    parser.add_argument("--output-dir", required=True, help="Output directory")
+    parser.add_argument("--input", help="Input model file")
+    parser.add_argument("--output-dir", help="Output directory")
     parser.add_argument("--type", choices=["preview", "turntable", "all"], default="preview")
     parser.add_argument("--cycles", action="store_true", help="Use Cycles renderer")
+    parser.add_argument("--parallel", action="store_true", help="Render shots/frames in parallel processes")
+    parser.add_argument("--shot", choices=list(JewelleryRenderer.PREVIEW_SHOTS), help="Render one shot of the open scene")
+    parser.add_argument("--frames", type=int, nargs=2, metavar=("START", "END"), help="Render a frame range of the open scene")
+    parser.add_argument("--output", help="Output image for --shot, or #### frame pattern for --frames")
+    parser.add_argument("--gpu-id", type=int, help="GPU index for --shot or --frames")
     
     args = parser.parse_args(argv)
     
-    renderer = JewelleryRenderer(args.input)
+    if args.frames:
+        # Turntable worker mode: the scene was opened by `blender -b scene.blend`
+        if not args.output:
+            parser.error("--frames requires --output")
+        
+        result = JewelleryRenderer().render_frames(args.output, *args.frames, args.cycles, args.gpu_id)
+        print(f"Frame range render: {result}")
+    
+    elif args.shot:
+        # Worker mode: the scene was opened by `blender -b scene.blend`
+        if not args.output:
+            parser.error("--shot requires --output")
+        
+        result = JewelleryRenderer().render_shot(args.shot, args.output, args.cycles, args.gpu_id)
+        print(f"Shot render: {result}")
     
-    if args.type in ["preview", "all"]:
-        result = renderer.render_previews(args.output_dir, args.cycles)
-        print(f"Preview render: {result}")
+    elif not args.input or not args.output_dir:
+        parser.error("--input and --output-dir are required")
     
-    if args.type in ["turntable", "all"]:
-        turntable_path = os.path.join(args.output_dir, "turntable.mp4")
-        result = renderer.render_turntable(turntable_path, args.cycles)
-        print(f"Turntable render: {result}")
+    else:
+        renderer = JewelleryRenderer(args.input)
+        
+        if args.type in ["preview", "all"]:
+            result = renderer.render_previews(args.output_dir, args.cycles, args.parallel)
+            print(f"Preview render: {result}")
+        
+        if args.type in ["turntable", "all"]:
+            turntable_path = os.path.join(args.output_dir, "turntable.mp4")
+            result = renderer.render_turntable(turntable_path, args.cycles, args.parallel)
+            print(f"Turntable render: {result}")
@@ -6,7 +6,7 @@ Operations:
 - Resize textures (1024px / 2048px)
 - Convert to optimized formats
 - Remove unused texture maps
-- Compress for WebAR
+- Compress for WebAR (optional KTX2/UASTC copies via toktx)
 - Maintain gold reflections and gem sparkle
 
 Usage:
@@ -15,13 +15,42 @@ Usage:
 
 import sys
 import os
+import re
+import importlib.util
+import json
+import shutil
+import subprocess
+import tempfile
+from urllib.parse import unquote
 
 try:
     import bpy
+    import numpy as np
     IN_BLENDER = True
 except ImportError:
     IN_BLENDER = False
 
+# Optional GPU resize (torch is not bundled with Blender). torch is only
+# imported when there is something to resize, since it is slow to import
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+
+# Optional libjpeg-turbo encoder for packing JPEG textures
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Optional SIMD PNG encoder (pyspng-seunglab)
+try:
+    import pyspng
+    PYSPNG_AVAILABLE = True
+except ImportError:
+    PYSPNG_AVAILABLE = False
+
+# Material name patterns for jewellery optimization
+GEM_RE = re.compile(r'gem|diamond|ruby|sapphire|emerald')
+
 
 class TextureOptimizer:
     """Optimizes textures for mobile AR"""
@@ -32,10 +61,16 @@ class TextureOptimizer:
     # Essential texture types to keep
     ESSENTIAL_TYPES = ['base_color', 'metallic', 'roughness', 'normal']
     
-    def __init__(self, filepath: str = None, max_size: int = 1024):
+    # Principled BSDF input name -> socket index, probed on first use
+    _socket_index = None
+    
+    def __init__(self, filepath: str = None, max_size: int = 1024, ktx2_dir: str = None):
         self.filepath = filepath
         self.max_size = max_size
+        self.ktx2_dir = ktx2_dir
         self.log = []
+        self._resize_events = []
+        self._temp_dir = None
     
     def optimize(self) -> dict:
         """
@@ -52,19 +87,28 @@ class TextureOptimizer:
         
         initial_count = len(bpy.data.images)
         
-        # Run optimization steps
-        self._resize_textures()
-        self._remove_unused_textures()
-        self._optimize_materials()
-        self._pack_textures()
+        # Run optimization steps (one pass over materials, one over images)
+        used_images = self._optimize_materials()
+        self._process_images(used_images)
+        
+        ktx2_files = self._export_ktx2() if self.ktx2_dir else []
+        
+        # Pre-scaled sources are packed now; drop the temp copies
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
         
         final_count = len(bpy.data.images)
         
+        self.log.extend(f"Resized: {name} to {w}x{h}" for name, w, h in self._resize_events)
+        self._resize_events.clear()
+        
         return {
             "success": True,
             "initial_textures": initial_count,
             "final_textures": final_count,
             "max_size": self.max_size,
+            "ktx2_files": ktx2_files,
             "log": self.log
         }
     
@@ -72,130 +116,475 @@ class TextureOptimizer:
         """Load the 3D model file"""
         ext = os.path.splitext(self.filepath)[1].lower()
         
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
+        # Clear existing objects in one batch (no selection pass)
+        bpy.data.batch_remove(list(bpy.data.objects))
+        
+        self._prefetch_file(self.filepath)
         
         if ext == ".blend":
             bpy.ops.wm.open_mainfile(filepath=self.filepath)
         elif ext == ".fbx":
             bpy.ops.import_scene.fbx(filepath=self.filepath)
         elif ext in [".glb", ".gltf"]:
-            bpy.ops.import_scene.gltf(filepath=self.filepath)
+            filepath = self.filepath
+            if ext == ".gltf" and TURBOJPEG_AVAILABLE:
+                filepath = self._prescale_gltf_jpegs(filepath)
+            bpy.ops.import_scene.gltf(filepath=filepath)
     
-    def _resize_textures(self):
-        """Resize textures to max size"""
-        resized = 0
+    def _prefetch_file(self, path: str):
+        """
+        Start kernel readahead of the model file before Blender imports it.
         
-        for img in bpy.data.images:
-            if img.size[0] == 0 or img.size[1] == 0:
+        The importers open the file themselves, so the hint is WILLNEED
+        (page cache prefetch) rather than a per-descriptor access pattern.
+        No-op where posix_fadvise is unavailable.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    
+    def _prescale_gltf_jpegs(self, gltf_path: str) -> str:
+        """
+        Decode oversized external JPEGs at reduced scale before import.
+        
+        libjpeg-turbo can scale by 1/2, 1/4 or 1/8 inside the IDCT, so each
+        JPEG is decoded at the smallest of those scales that still covers
+        max_size and re-encoded into a temp directory.
+        
+        Returns:
+            Path of a rewritten .gltf pointing at the smaller files, or the
+            original path when nothing needed scaling
+        """
+        with open(gltf_path, "r", encoding="utf-8") as f:
+            gltf = json.load(f)
+        
+        base_dir = os.path.dirname(os.path.abspath(gltf_path))
+        tj = TurboJPEG()
+        scaled = 0
+        
+        for index, image in enumerate(gltf.get("images", [])):
+            uri = image.get("uri", "")
+            if uri.startswith("data:") or not uri.lower().endswith((".jpg", ".jpeg")):
                 continue
             
-            # Skip if already within limits
-            if img.size[0] <= self.max_size and img.size[1] <= self.max_size:
+            src = os.path.join(base_dir, unquote(uri))
+            if not os.path.isfile(src):
                 continue
             
-            # Calculate new size maintaining aspect ratio
-            aspect = img.size[0] / img.size[1]
+            with open(src, "rb") as f:
+                data = f.read()
             
-            if img.size[0] > img.size[1]:
-                new_width = self.max_size
-                new_height = int(self.max_size / aspect)
-            else:
-                new_height = self.max_size
-                new_width = int(self.max_size * aspect)
+            width, height, _, _ = tj.decode_header(data)
+            denom = 1
+            while denom < 8 and max(width, height) // (denom * 2) >= self.max_size:
+                denom *= 2
             
-            # Resize
-            img.scale(new_width, new_height)
-            resized += 1
+            if denom == 1:
+                continue
             
-            self.log.append(f"Resized: {img.name} to {new_width}x{new_height}")
+            if self._temp_dir is None:
+                self._temp_dir = tempfile.mkdtemp(prefix="texopt_")
+            
+            dst = os.path.join(self._temp_dir, f"{index}_{os.path.basename(src)}")
+            pixels = tj.decode(data, scaling_factor=(1, denom))
+            with open(dst, "wb") as f:
+                f.write(tj.encode(pixels, quality=95))
+            
+            image["uri"] = dst.replace(os.sep, "/")
+            scaled += 1
+        
+        if not scaled:
+            return gltf_path
         
-        self.log.append(f"Resized {resized} textures to max {self.max_size}px")
+        # Keep the remaining relative URIs resolvable from the temp copy
+        for key in ("buffers", "images"):
+            for item in gltf.get(key, []):
+                uri = item.get("uri")
+                if uri and not uri.startswith("data:") and not os.path.isabs(unquote(uri)):
+                    item["uri"] = os.path.join(base_dir, unquote(uri)).replace(os.sep, "/")
+        
+        out_path = os.path.join(self._temp_dir, os.path.basename(gltf_path))
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(gltf, f)
+        
+        self.log.append(f"Pre-scaled {scaled} JPEG textures at decode time")
+        return out_path
     
-    def _remove_unused_textures(self):
-        """Remove textures not used in any material"""
-        used_images = set()
+    def _process_images(self, used_images: set):
+        """
+        Classify every image in a single pass, then remove, resize and pack.
         
-        # Find all images used in materials
-        for mat in bpy.data.materials:
-            if mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'TEX_IMAGE' and node.image:
-                        used_images.add(node.image.name)
+        Args:
+            used_images: Names of images referenced by material nodes
+        """
+        to_remove = []
+        jobs = []
+        to_pack = []  # Names: GPU resizing replaces the image datablocks
+        
+        for img in bpy.data.images:
+            # Unused images are dropped before any resize or pack work
+            if img.users == 0 and img.name not in used_images:
+                to_remove.append(img)
+                continue
+            
+            new_size = self._target_size(img)
+            if new_size:
+                jobs.append((img, *new_size))
+            
+            if img.packed_file is None and img.filepath:
+                to_pack.append(img.name)
+        
+        resized = {img.name for img, _w, _h in jobs}
+        
+        self._remove_unused_textures(to_remove)
+        self._resize_textures(jobs)
+        self._pack_textures([bpy.data.images[name] for name in to_pack], resized)
+    
+    def _target_size(self, img):
+        """
+        Size an image should be scaled to, or None if it is within limits.
+        
+        Returns:
+            Tuple of (width, height) or None
+        """
+        width, height = img.size
+        
+        if width == 0 or height == 0:
+            return None
+        
+        # Skip if already within limits
+        if width <= self.max_size and height <= self.max_size:
+            return None
+        
+        # Square maps (the common case) need no aspect ratio math
+        if width == height:
+            return (self.max_size, self.max_size)
+        
+        # Calculate new size maintaining aspect ratio (integer math)
+        long_side = max(width, height)
+        new_short = (self.max_size * min(width, height)) // long_side
+        
+        return (self.max_size, new_short) if width > height else (new_short, self.max_size)
+    
+    def _resize_textures(self, jobs: list):
+        """
+        Resize textures to max size.
+        
+        Args:
+            jobs: List of (image, new_width, new_height) tuples
+        """
+        # Per-image lines are formatted once optimize() returns
+        self._resize_events.extend((img.name, new_width, new_height) for img, new_width, new_height in jobs)
         
-        # Remove unused
-        removed = 0
-        for img in list(bpy.data.images):
-            if img.name not in used_images and img.users == 0:
-                bpy.data.images.remove(img)
-                removed += 1
+        if not (jobs and TORCH_AVAILABLE and self._resize_on_gpu(jobs)):
+            # bpy calls are not thread-safe, so CPU resizes run on the main thread
+            for img, new_width, new_height in jobs:
+                img.scale(new_width, new_height)
         
-        self.log.append(f"Removed {removed} unused textures")
+        self.log.append(f"Resized {len(jobs)} textures to max {self.max_size}px")
     
-    def _optimize_materials(self):
-        """Optimize materials for jewellery rendering"""
+    def _resize_on_gpu(self, jobs: list) -> bool:
+        """
+        Area-filter oversized textures on the GPU in batches.
+        
+        Images with the same source and target dimensions are stacked into
+        one tensor and resized with a single interpolate call. The filtered
+        pixels go into new images that replace the originals, so Blender
+        never runs its own CPU filter.
+        
+        Returns:
+            False if no CUDA device is available
+        """
+        import torch
+        import torch.nn.functional as F
+        
+        if not torch.cuda.is_available():
+            return False
+        
+        groups = {}
+        for img, new_width, new_height in jobs:
+            key = (img.size[0], img.size[1], img.channels, new_width, new_height)
+            groups.setdefault(key, []).append(img)
+        
+        for (width, height, channels, new_width, new_height), images in groups.items():
+            batch = np.empty((len(images), height, width, channels), dtype=np.float32)
+            for i, img in enumerate(images):
+                img.pixels.foreach_get(batch[i].ravel())
+            
+            pixels = torch.from_numpy(batch).cuda().permute(0, 3, 1, 2)
+            resized = F.interpolate(pixels, size=(new_height, new_width), mode='area')
+            resized = resized.permute(0, 2, 3, 1).contiguous().cpu().numpy()
+            
+            for img, buf in zip(images, resized):
+                self._replace_image(img, buf)
+        
+        return True
+    
+    @staticmethod
+    def _replace_image(img, pixels):
+        """
+        Swap an image for a new one holding the given pixels.
+        
+        Args:
+            img: Image to replace; removed afterwards
+            pixels: Array of shape (height, width, img.channels)
+        """
+        height, width, channels = pixels.shape
+        
+        # New images are always RGBA
+        if channels < 4:
+            rgba = np.ones((height, width, 4), dtype=np.float32)
+            rgba[..., :3] = pixels[..., :3] if channels >= 3 else pixels[..., :1]
+            pixels = rgba
+        
+        new = bpy.data.images.new(
+            img.name, width, height,
+            alpha=img.alpha_mode != 'NONE',
+            float_buffer=img.is_float
+        )
+        new.pixels.foreach_set(pixels.ravel())
+        new.colorspace_settings.name = img.colorspace_settings.name
+        new.alpha_mode = img.alpha_mode
+        new.filepath_raw = img.filepath_raw
+        new.file_format = img.file_format
+        
+        was_packed = img.packed_file is not None
+        name = img.name
+        
+        img.user_remap(new)
+        bpy.data.images.remove(img)
+        new.name = name
+        
+        if was_packed:
+            new.pack()
+    
+    def _remove_unused_textures(self, to_remove: list):
+        """Remove textures not used in any material, in one batch"""
+        bpy.data.batch_remove(to_remove)
+        
+        self.log.append(f"Removed {len(to_remove)} unused textures")
+    
+    def _optimize_materials(self) -> set:
+        """
+        Optimize materials for jewellery rendering.
+        
+        Each node tree is walked once, which also collects the images
+        the materials reference.
+        
+        Returns:
+            Names of images used in materials
+        """
+        used_images = set()
+        
         for mat in bpy.data.materials:
             if not mat.use_nodes:
                 continue
             
-            # Get principled BSDF node
+            # Find used images and the principled BSDF node
             principled = None
             for node in mat.node_tree.nodes:
-                if node.type == 'BSDF_PRINCIPLED':
+                if node.type == 'TEX_IMAGE':
+                    if node.image:
+                        used_images.add(node.image.name)
+                elif node.type == 'BSDF_PRINCIPLED' and principled is None:
                     principled = node
-                    break
             
             if not principled:
                 continue
             
             # Optimize for jewellery
             mat_name = mat.name.lower()
+            inputs = principled.inputs
+            idx = self._principled_sockets(principled)
             
             # Gold material optimization
             if 'gold' in mat_name:
-                principled.inputs['Metallic'].default_value = 1.0
-                principled.inputs['Roughness'].default_value = 0.2
+                inputs[idx['Metallic']].default_value = 1.0
+                inputs[idx['Roughness']].default_value = 0.2
                 # Gold color
-                if not principled.inputs['Base Color'].is_linked:
-                    principled.inputs['Base Color'].default_value = (1.0, 0.843, 0.0, 1.0)
+                base_color = inputs[idx['Base Color']]
+                if not base_color.is_linked:
+                    base_color.default_value = (1.0, 0.843, 0.0, 1.0)
             
             # Silver material optimization
             elif 'silver' in mat_name:
-                principled.inputs['Metallic'].default_value = 1.0
-                principled.inputs['Roughness'].default_value = 0.15
-                if not principled.inputs['Base Color'].is_linked:
-                    principled.inputs['Base Color'].default_value = (0.97, 0.97, 0.97, 1.0)
+                inputs[idx['Metallic']].default_value = 1.0
+                inputs[idx['Roughness']].default_value = 0.15
+                base_color = inputs[idx['Base Color']]
+                if not base_color.is_linked:
+                    base_color.default_value = (0.97, 0.97, 0.97, 1.0)
             
             # Gemstone optimization
-            elif any(gem in mat_name for gem in ['gem', 'diamond', 'ruby', 'sapphire', 'emerald']):
-                principled.inputs['Metallic'].default_value = 0.0
-                principled.inputs['Roughness'].default_value = 0.0
-                principled.inputs['Transmission'].default_value = 0.95
-                principled.inputs['IOR'].default_value = 2.4  # Diamond-like
+            elif GEM_RE.search(mat_name):
+                inputs[idx['Metallic']].default_value = 0.0
+                inputs[idx['Roughness']].default_value = 0.0
+                inputs[idx['Transmission']].default_value = 0.95
+                inputs[idx['IOR']].default_value = 2.4  # Diamond-like
         
         self.log.append("Optimized materials for jewellery rendering")
+        
+        return used_images
     
-    def _pack_textures(self):
-        """Pack all textures into the blend file"""
-        for img in bpy.data.images:
-            if img.packed_file is None and img.filepath:
+    @classmethod
+    def _principled_sockets(cls, principled) -> dict:
+        """Map Principled BSDF input names to socket indices (probed once)"""
+        if cls._socket_index is None:
+            index = {sock.name: i for i, sock in enumerate(principled.inputs)}
+            # Blender 4.x renamed Transmission to Transmission Weight
+            if 'Transmission' not in index and 'Transmission Weight' in index:
+                index['Transmission'] = index['Transmission Weight']
+            cls._socket_index = index
+        return cls._socket_index
+    
+    def _pack_textures(self, images: list, resized: set):
+        """
+        Pack textures into the blend file.
+        
+        Args:
+            images: Images to pack
+            resized: Names of images resized in this run
+        """
+        tj = TurboJPEG() if TURBOJPEG_AVAILABLE else None
+        
+        for img in images:
+            filepath = img.filepath.lower()
+            modified = img.name in resized or img.is_dirty
+            data = None
+            
+            # Encode modified pixels with the faster codecs where possible;
+            # untouched images keep their original bytes, re-encoding them
+            # is extra work (and loses quality for JPEG)
+            if modified:
                 try:
+                    if tj and filepath.endswith(('.jpg', '.jpeg')):
+                        data = self._encode_jpeg(tj, img)
+                    elif PYSPNG_AVAILABLE and filepath.endswith('.png') and not img.is_float:
+                        data = self._encode_png(img)
+                except Exception:
+                    data = None
+            
+            try:
+                if data:
+                    img.pack(data=data, data_len=len(data))
+                else:
                     img.pack()
-                except:
-                    pass
+            except:
+                pass
         
         self.log.append("Packed all textures")
     
+    def _encode_jpeg(self, tj, img, quality: int = 85) -> bytes:
+        """Encode an image's current pixels to JPEG with libjpeg-turbo"""
+        width, height = img.size
+        channels = img.channels
+        
+        pixels = np.empty(width * height * channels, dtype=np.float32)
+        img.pixels.foreach_get(pixels)
+        
+        # Blender stores rows bottom-up; JPEG expects top-down RGB bytes
+        pixels = pixels.reshape(height, width, channels)[::-1, :, :3]
+        rgb = np.ascontiguousarray(np.clip(pixels * 255.0 + 0.5, 0, 255).astype(np.uint8))
+        
+        return tj.encode(rgb, quality=quality, pixel_format=TJPF_RGB)
+    
+    def _encode_png(self, img) -> bytes:
+        """Encode an 8-bit image's current pixels to PNG with pyspng"""
+        width, height = img.size
+        channels = img.channels
+        
+        pixels = np.empty(width * height * channels, dtype=np.float32)
+        img.pixels.foreach_get(pixels)
+        
+        # Blender stores rows bottom-up; PNG expects top-down
+        pixels = pixels.reshape(height, width, channels)[::-1]
+        data = np.ascontiguousarray(np.clip(pixels * 255.0 + 0.5, 0, 255).astype(np.uint8))
+        
+        return pyspng.encode(data)
+    
+    def _export_ktx2(self) -> list:
+        """
+        Write GPU-compressed KTX2 (UASTC) copies of the textures for WebAR.
+        
+        The images inside the .blend stay as they are, since Blender cannot
+        load KTX2. Color data keeps the sRGB transfer; Non-Color maps
+        (normal, roughness, metallic) are tagged linear.
+        
+        Returns:
+            List of written .ktx2 paths
+        """
+        toktx = shutil.which("toktx")
+        if not toktx:
+            self.log.append("toktx not found, skipped KTX2 export")
+            return []
+        
+        os.makedirs(self.ktx2_dir, exist_ok=True)
+        work_dir = tempfile.mkdtemp(prefix="texopt_ktx2_")
+        written = []
+        used_names = set()
+        
+        try:
+            # Snapshot the images: the temporary copies below add to and
+            # remove from bpy.data.images while the loop runs
+            for img in list(bpy.data.images):
+                if img.size[0] == 0 or img.size[1] == 0:
+                    continue
+                
+                # albedo.png and albedo.jpg would both clean to albedo
+                base = bpy.path.clean_name(os.path.splitext(img.name)[0])
+                name = base
+                suffix = 1
+                while name in used_names:
+                    name = f"{base}_{suffix}"
+                    suffix += 1
+                used_names.add(name)
+                
+                png_path = os.path.join(work_dir, f"{name}.png")
+                ktx2_path = os.path.join(self.ktx2_dir, f"{name}.ktx2")
+                
+                # Write the current pixels through a copy so img keeps its path
+                tmp = img.copy()
+                tmp.filepath_raw = png_path
+                tmp.file_format = 'PNG'
+                tmp.save()
+                bpy.data.images.remove(tmp)
+                
+                cmd = [toktx, "--t2", "--encode", "uastc", "--uastc_quality", "2", "--zcmp", "18"]
+                if img.colorspace_settings.name == 'Non-Color':
+                    cmd += ["--assign_oetf", "linear"]
+                cmd += [ktx2_path, png_path]
+                
+                if subprocess.run(cmd, capture_output=True).returncode == 0:
+                    written.append(ktx2_path)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        
+        self.log.append(f"Exported {len(written)} KTX2 textures to {self.ktx2_dir}")
+        return written
+    
     def save(self, output_path: str):
         """Save the optimized model"""
         bpy.ops.wm.save_as_mainfile(filepath=output_path)
 
 
-def optimize_textures(input_path: str, output_path: str = None, max_size: int = 1024) -> dict:
+def optimize_textures(
+    input_path: str,
+    output_path: str = None,
+    max_size: int = 1024,
+    ktx2_dir: str = None
+) -> dict:
     """
     Convenience function to optimize textures.
     """
-    optimizer = TextureOptimizer(input_path, max_size)
+    optimizer = TextureOptimizer(input_path, max_size, ktx2_dir)
     result = optimizer.optimize()
     
     if output_path and result["success"]:
@@ -217,8 +606,9 @@ if __name__ == "__main__" and IN_BLENDER:
     parser.add_argument("--input", required=True, help="Input model file")
     parser.add_argument("--output", help="Output model file")
     parser.add_argument("--max-size", type=int, default=1024, help="Max texture size")
+    parser.add_argument("--ktx2-dir", help="Also write KTX2 (UASTC) textures here")
     
     args = parser.parse_args(argv)
     
-    result = optimize_textures(args.input, args.output, args.max_size)
+    result = optimize_textures(args.input, args.output, args.max_size, args.ktx2_dir)
     print(f"Texture optimization complete: {result}")
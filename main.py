@@ -5,7 +5,9 @@ Main FastAPI Application Entry Point
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 
 from app.config import get_settings
 from app.database import connect_to_database, close_database_connection
@@ -17,6 +19,7 @@ from app.routes import (
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_validation import ValidationMiddleware
 from app.services.task_queue import task_queue
+from app.utils.auth import configure_password_hashing
 
 
 @asynccontextmanager
@@ -28,9 +31,14 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting MegaArtsStore Backend...")
     await connect_to_database()
+    bcrypt_rounds = await asyncio.to_thread(configure_password_hashing)
+    print(f"✅ Password hashing ready (bcrypt rounds: {bcrypt_rounds})")
     await task_queue.start()
     print("✅ Task queue started")
     
+    # Build the OpenAPI schema now so the first /docs hit doesn't pay for it
+    app.openapi()
+    
     yield
     
     # Shutdown
@@ -48,6 +56,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -67,34 +76,39 @@ app.add_middleware(RateLimitMiddleware)
 # API v1 Routes
 API_V1_PREFIX = "/api/v1"
 
-# Core Features
-app.include_router(auth.router, prefix=f"{API_V1_PREFIX}/auth", tags=["Authentication"])
-app.include_router(products.router, prefix=f"{API_V1_PREFIX}/products", tags=["Products"])
-app.include_router(orders.router, prefix=f"{API_V1_PREFIX}/orders", tags=["Orders"])
-app.include_router(cart.router, prefix=f"{API_V1_PREFIX}/cart", tags=["Cart"])
-app.include_router(wishlist.router, prefix=f"{API_V1_PREFIX}/wishlist", tags=["Wishlist"])
-app.include_router(reviews.router, prefix=f"{API_V1_PREFIX}/reviews", tags=["Reviews"])
-app.include_router(payment.router, prefix=f"{API_V1_PREFIX}/payment", tags=["Payments"])
-
-# AR & 3D Features
-app.include_router(render.router, prefix=f"{API_V1_PREFIX}/render", tags=["3D Rendering"])
-app.include_router(ar_analytics.router, prefix=f"{API_V1_PREFIX}/ar", tags=["AR Analytics"])
-
-# Admin Features
-app.include_router(admin.router, prefix=f"{API_V1_PREFIX}/admin", tags=["Admin Dashboard"])
-app.include_router(bulk_operations.router, prefix=f"{API_V1_PREFIX}/bulk", tags=["Bulk Operations"])
-app.include_router(inventory.router, prefix=f"{API_V1_PREFIX}/inventory", tags=["Inventory Management"])
-app.include_router(exports.router, prefix=f"{API_V1_PREFIX}/exports", tags=["Data Export"])
-
-# Advanced Features
-app.include_router(coupons.router, prefix=f"{API_V1_PREFIX}/coupons", tags=["Coupons & Discounts"])
-app.include_router(security.router, prefix=f"{API_V1_PREFIX}/security", tags=["Security"])
-app.include_router(search.router, prefix=f"{API_V1_PREFIX}/search", tags=["Search"])
-app.include_router(recommendations.router, prefix=f"{API_V1_PREFIX}/recommendations", tags=["Recommendations"])
-app.include_router(tasks.router, prefix=f"{API_V1_PREFIX}/tasks", tags=["Task Queue"])
-
-# Health & Monitoring (no versioning for health checks)
-app.include_router(health.router, prefix="/health", tags=["Health & Monitoring"])
+ROUTER_SPEC = (
+    # Core Features
+    (auth.router, f"{API_V1_PREFIX}/auth", ["Authentication"]),
+    (products.router, f"{API_V1_PREFIX}/products", ["Products"]),
+    (orders.router, f"{API_V1_PREFIX}/orders", ["Orders"]),
+    (cart.router, f"{API_V1_PREFIX}/cart", ["Cart"]),
+    (wishlist.router, f"{API_V1_PREFIX}/wishlist", ["Wishlist"]),
+    (reviews.router, f"{API_V1_PREFIX}/reviews", ["Reviews"]),
+    (payment.router, f"{API_V1_PREFIX}/payment", ["Payments"]),
+    
+    # AR & 3D Features
+    (render.router, f"{API_V1_PREFIX}/render", ["3D Rendering"]),
+    (ar_analytics.router, f"{API_V1_PREFIX}/ar", ["AR Analytics"]),
+    
+    # Admin Features
+    (admin.router, f"{API_V1_PREFIX}/admin", ["Admin Dashboard"]),
+    (bulk_operations.router, f"{API_V1_PREFIX}/bulk", ["Bulk Operations"]),
+    (inventory.router, f"{API_V1_PREFIX}/inventory", ["Inventory Management"]),
+    (exports.router, f"{API_V1_PREFIX}/exports", ["Data Export"]),
+    
+    # Advanced Features
+    (coupons.router, f"{API_V1_PREFIX}/coupons", ["Coupons & Discounts"]),
+    (security.router, f"{API_V1_PREFIX}/security", ["Security"]),
+    (search.router, f"{API_V1_PREFIX}/search", ["Search"]),
+    (recommendations.router, f"{API_V1_PREFIX}/recommendations", ["Recommendations"]),
+    (tasks.router, f"{API_V1_PREFIX}/tasks", ["Task Queue"]),
+    
+    # Health & Monitoring (no versioning for health checks)
+    (health.router, "/health", ["Health & Monitoring"]),
+)
+
+for router, prefix, tags in ROUTER_SPEC:
+    app.include_router(router, prefix=prefix, tags=tags)
 
 
 @app.get("/", tags=["Root"])
@@ -0,0 +1,227 @@
+"""
+In-memory stand-in for the Motor database used by the route tests.
+Supports the query and update operators the routes use; aggregation
+pipelines return no results.
+"""
+
+import copy
+import re
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+
+def _get_path(doc: dict, path: str):
+    """Resolve a dotted key, returning (found, value)"""
+    value = doc
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return False, None
+        value = value[part]
+    return True, value
+
+
+def _match_condition(found: bool, value, condition) -> bool:
+    """Check one field against a literal or an operator dict"""
+    if not (isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition)):
+        if isinstance(value, list) and not isinstance(condition, list):
+            return condition in value
+        return found and value == condition
+    
+    for op, operand in condition.items():
+        if op == "$in":
+            ok = found and (value in operand or (isinstance(value, list) and any(v in operand for v in value)))
+        elif op == "$nin":
+            ok = not found or value not in operand
+        elif op == "$ne":
+            ok = not found or value != operand
+        elif op == "$gt":
+            ok = found and value is not None and value > operand
+        elif op == "$gte":
+            ok = found and value is not None and value >= operand
+        elif op == "$lt":
+            ok = found and value is not None and value < operand
+        elif op == "$lte":
+            ok = found and value is not None and value <= operand
+        elif op == "$exists":
+            ok = found == bool(operand)
+        elif op == "$regex":
+            flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+            ok = found and isinstance(value, str) and re.search(operand, value, flags) is not None
+        elif op == "$options":
+            ok = True
+        else:
+            raise NotImplementedError(f"Query operator {op} not supported by FakeCollection")
+        
+        if not ok:
+            return False
+    
+    return True
+
+
+def matches(doc: dict, query: dict) -> bool:
+    """Check whether a document satisfies a Mongo-style query"""
+    for key, condition in (query or {}).items():
+        if key == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif not _match_condition(*_get_path(doc, key), condition):
+            return False
+    return True
+
+
+class FakeCursor:
+    """Cursor over a snapshot of matching documents"""
+    
+    def __init__(self, docs: list):
+        self._docs = docs
+    
+    def sort(self, key, direction=1):
+        keys = key if isinstance(key, list) else [(key, direction)]
+        for field, order in reversed(keys):
+            self._docs.sort(key=lambda d: (_get_path(d, field)[1] is None, _get_path(d, field)[1]), reverse=order < 0)
+        return self
+    
+    def skip(self, count: int):
+        self._docs = self._docs[count:]
+        return self
+    
+    def limit(self, count: int):
+        if count:
+            self._docs = self._docs[:count]
+        return self
+    
+    async def to_list(self, length=None):
+        return self._docs if length is None else self._docs[:length]
+    
+    def __aiter__(self):
+        self._iter = iter(self._docs)
+        return self
+    
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    """Dict-backed collection keyed by _id"""
+    
+    def __init__(self):
+        self._docs = {}
+    
+    def load(self, documents: list):
+        """Replace the collection contents with copies of documents"""
+        self._docs = {doc["_id"]: copy.deepcopy(doc) for doc in documents}
+    
+    def _matching(self, query: dict) -> list:
+        return [doc for doc in self._docs.values() if matches(doc, query)]
+    
+    async def find_one(self, query: dict = None, *args, **kwargs):
+        for doc in self._docs.values():
+            if matches(doc, query):
+                return copy.deepcopy(doc)
+        return None
+    
+    def find(self, query: dict = None, *args, **kwargs) -> FakeCursor:
+        return FakeCursor(copy.deepcopy(self._matching(query)))
+    
+    async def count_documents(self, query: dict = None, **kwargs) -> int:
+        return len(self._matching(query))
+    
+    async def distinct(self, key: str, query: dict = None, **kwargs) -> list:
+        values = []
+        for doc in self._matching(query):
+            found, value = _get_path(doc, key)
+            for item in (value if isinstance(value, list) else [value]) if found else []:
+                if item not in values:
+                    values.append(item)
+        return values
+    
+    def aggregate(self, pipeline: list, **kwargs) -> FakeCursor:
+        return FakeCursor([])
+    
+    async def insert_one(self, document: dict, **kwargs):
+        document.setdefault("_id", ObjectId())
+        self._docs[document["_id"]] = copy.deepcopy(document)
+        return SimpleNamespace(inserted_id=document["_id"], acknowledged=True)
+    
+    async def update_one(self, query: dict, update: dict, upsert: bool = False, **kwargs):
+        matched = self._matching(query)
+        
+        if matched:
+            self._apply_update(matched[0], update)
+            return SimpleNamespace(matched_count=1, modified_count=1, upserted_id=None)
+        
+        if upsert:
+            doc = {k: v for k, v in query.items() if not k.startswith("$") and not isinstance(v, dict)}
+            self._apply_update(doc, update)
+            self._apply_update(doc, {"$set": update.get("$setOnInsert", {})})
+            result = await self.insert_one(doc)
+            return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=result.inserted_id)
+        
+        return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=None)
+    
+    async def delete_one(self, query: dict, **kwargs):
+        matched = self._matching(query)
+        if matched:
+            del self._docs[matched[0]["_id"]]
+        return SimpleNamespace(deleted_count=len(matched[:1]))
+    
+    @staticmethod
+    def _apply_update(doc: dict, update: dict):
+        """Apply update operators to a document in place"""
+        for op, fields in update.items():
+            for key, value in fields.items():
+                *parents, leaf = key.split(".")
+                target = doc
+                for part in parents:
+                    target = target.setdefault(part, {})
+                
+                if op == "$set":
+                    target[leaf] = copy.deepcopy(value)
+                elif op == "$unset":
+                    target.pop(leaf, None)
+                elif op == "$inc":
+                    target[leaf] = target.get(leaf, 0) + value
+                elif op == "$push":
+                    target.setdefault(leaf, []).append(copy.deepcopy(value))
+                elif op == "$addToSet":
+                    items = target.setdefault(leaf, [])
+                    if value not in items:
+                        items.append(copy.deepcopy(value))
+                elif op == "$pull":
+                    target[leaf] = [
+                        item for item in target.get(leaf, [])
+                        if not (matches(item, value) if isinstance(value, dict) else item == value)
+                    ]
+                elif op == "$setOnInsert":
+                    continue
+                else:
+                    raise NotImplementedError(f"Update operator {op} not supported by FakeCollection")
+
+
+class FakeDatabase:
+    """Database whose collections are created on first access"""
+    
+    def __init__(self):
+        self._collections = {}
+    
+    def __getitem__(self, name: str) -> FakeCollection:
+        if name not in self._collections:
+            self._collections[name] = FakeCollection()
+        return self._collections[name]
+    
+    def __getattr__(self, name: str) -> FakeCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+    
+    def reset(self):
+        """Empty every collection, keeping the collection objects"""
+        for collection in self._collections.values():
+            collection._docs.clear()
@@ -0,0 +1,39 @@
+"""
+Settings served to the app in place of app.config.get_settings
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeSettings:
+    """Read-only test settings with the fields the app reads"""
+    mongodb_uri: str = 'mongodb://localhost:27017'
+    database_name: str = 'test_megaartsstore'
+    jwt_secret_key: str = 'test-secret-key'
+    jwt_algorithm: str = 'HS256'
+    access_token_expire_minutes: int = 30
+    cloudinary_cloud_name: str = 'test'
+    cloudinary_api_key: str = 'test'
+    cloudinary_api_secret: str = 'test'
+    razorpay_key_id: str = 'rzp_test_key'
+    razorpay_key_secret: str = 'test-razorpay-secret'
+    smtp_host: str = ''  # Empty host: emails are skipped
+    smtp_port: int = 587
+    smtp_user: str = ''
+    smtp_password: str = ''
+    smtp_from_email: str = 'noreply@megaartsstore.com'
+    blender_enabled: bool = False
+    blender_path: str = ''
+    debug: bool = True
+    cors_origins: List[str] = field(default_factory=lambda: ['http://localhost:3000'])
+    bcrypt_rounds: int = 4
+    bcrypt_target_ms: int = 250
+
+
+@lru_cache(maxsize=1)
+def fake_settings() -> _FakeSettings:
+    """Test settings, built once per process"""
+    return _FakeSettings()
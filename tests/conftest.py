@@ -0,0 +1,178 @@
+"""
+Shared test fixtures
+"""
+
+from datetime import timedelta
+import sys
+import pytest
+import pytest_asyncio
+from asgi_lifespan import LifespanManager
+from pytest_asyncio import is_async_test
+from httpx import AsyncClient, ASGITransport, Limits, Timeout
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+
+from _fake_db import FakeDatabase
+from _fake_settings import fake_settings
+
+
+TEST_USER_ID = "507f1f77bcf86cd799439011"
+
+_CLIENT_LIMITS = Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=300)
+_CLIENT_TIMEOUT = Timeout(10.0)
+
+# Documents present at the start of every test
+_SEED_DOCUMENTS = {
+    "users": [{
+        "_id": ObjectId(TEST_USER_ID),
+        "email": "test@example.com",
+        "name": "Test User",
+        "role": "user",
+        "is_active": True,
+        "cart": [],
+        "wishlist": []
+    }]
+}
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session loop the shared client lives on"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_settings():
+    """Serve the fake settings from app.config.get_settings for the whole run"""
+    from app import config
+    
+    original = config.get_settings
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config, "get_settings", fake_settings)
+        
+        # Modules imported before this ran hold the real function under their own name
+        for name, module in list(sys.modules.items()):
+            if name == "main" or name.startswith("app."):
+                if getattr(module, "get_settings", None) is original:
+                    mp.setattr(module, "get_settings", fake_settings)
+        
+        yield fake_settings()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_db(mock_settings):
+    """In-memory database served by app.database for the whole run"""
+    from app import database
+    
+    # Under pytest-xdist each worker is its own session, so workers never share a database
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, "_database", FakeDatabase())
+        yield database._database
+
+
+@pytest.fixture(autouse=True)
+def clean_db(fake_db):
+    """Empty the fake collections and re-seed them before each test"""
+    from app.services.cache_service import cache
+    
+    fake_db.reset()
+    for name, documents in _SEED_DOCUMENTS.items():
+        # load() deep-copies, so tests never mutate the seed literal
+        fake_db[name].load(documents)
+    
+    # product_service caches lookups, which would outlive the reset
+    cache._cache.clear()
+    return fake_db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing(mock_settings):
+    """Hash at the fake settings' low bcrypt cost so hashing doesn't dominate the run"""
+    from app.utils.auth import pwd_context
+    
+    pwd_context.update(bcrypt__rounds=mock_settings.bcrypt_rounds)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def lift_rate_limits():
+    """Every test request comes from one client address, so lift the API rate limits"""
+    from app.middleware import rate_limit
+    
+    unlimited = rate_limit.RateLimiter(
+        requests_per_minute=10**9,
+        requests_per_hour=10**9,
+        burst_limit=10**9
+    )
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(rate_limit, "rate_limiter", unlimited)
+        yield
+
+
+async def _skip_database_connection():
+    """The fake database is installed by the fake_db fixture instead"""
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app(fake_db):
+    """Application instance, with its lifespan run once per session"""
+    import main
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main, "connect_to_database", _skip_database_connection)
+        mp.setattr(main, "close_database_connection", _skip_database_connection)
+        
+        async with LifespanManager(main.app):
+            yield main.app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app):
+    """HTTP client bound to the app, shared by every test"""
+    from main import API_V1_PREFIX
+    
+    # Request paths in the tests are relative to the versioned API prefix.
+    # ASGITransport never sends lifespan events; the app fixture runs them once.
+    # The limits are dormant while a transport is passed in; they take effect
+    # for a test that drops the transport to hit a real URL.
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url=f"http://test{API_V1_PREFIX}",
+        limits=_CLIENT_LIMITS,
+        timeout=_CLIENT_TIMEOUT
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Authorization headers for a regular user, signed once per session"""
+    from app.utils.auth import create_access_token
+    
+    # Long expiry so the shared token stays valid for the whole run
+    token = create_access_token(
+        data={"sub": TEST_USER_ID, "email": "test@example.com", "role": "user"},
+        expires_delta=timedelta(days=1)
+    )
+    
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def products_collection_mock():
+    """Factory for a products collection mock with the query chain pre-wired"""
+    def _make(docs=(), count=0, found=None):
+        collection = MagicMock()
+        
+        cursor = collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=list(docs))
+        collection.count_documents = AsyncMock(return_value=count)
+        collection.find_one = AsyncMock(return_value=found)
+        
+        return collection
+    
+    return _make
@@ -3,137 +3,85 @@ Authentication Tests
 Tests for user registration, login, and role-based access
 """
 
-import pytest
-from httpx import AsyncClient, ASGITransport
-from unittest.mock import patch, AsyncMock
-import sys
-import os
+import base64
+import json
+import time
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+from httpx import AsyncClient
+from jose import jwt
 
 
-# Mock settings before importing app
-@pytest.fixture(autouse=True)
-def mock_settings():
-    """Mock settings for tests"""
-    with patch('app.config.get_settings') as mock:
-        mock.return_value = type('Settings', (), {
-            'mongodb_uri': 'mongodb://localhost:27017',
-            'database_name': 'test_megaartsstore',
-            'jwt_secret_key': 'test-secret-key',
-            'jwt_algorithm': 'HS256',
-            'access_token_expire_minutes': 30,
-            'cloudinary_cloud_name': 'test',
-            'cloudinary_api_key': 'test',
-            'cloudinary_api_secret': 'test',
-            'blender_enabled': False,
-            'blender_path': '',
-            'debug': True,
-            'cors_origins': ['http://localhost:3000']
-        })()
-        yield mock
+def _b64url(data: bytes) -> str:
+    """Unpadded base64url, as used in JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
 
 
-@pytest.fixture
-def mock_db():
-    """Mock database for tests"""
-    with patch('app.database.get_users_collection') as mock_users:
-        mock_users.return_value = AsyncMock()
-        yield mock_users
+def _token(claims: dict, secret: str, algorithm: str = "HS256") -> str:
+    """Sign claims with python-jose, independently of the app's verifier"""
+    return jwt.encode(claims, secret, algorithm=algorithm)
 
 
 class TestRegistration:
     """Tests for user registration"""
     
     @pytest.mark.asyncio
-    async def test_register_success(self, mock_db):
+    async def test_register_success(self, client: AsyncClient, fake_db):
         """Test successful user registration"""
-        # Mock database operations
-        mock_db.return_value.find_one = AsyncMock(return_value=None)
-        mock_db.return_value.insert_one = AsyncMock(
-            return_value=type('Result', (), {'inserted_id': '507f1f77bcf86cd799439011'})()
+        response = await client.post(
+            "/auth/register",
+            json={
+                "email": "new-user@example.com",
+                "password": "securepassword123",
+                "name": "New User"
+            }
         )
         
-        from main import app
-        
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/auth/register",
-                json={
-                    "email": "test@example.com",
-                    "password": "securepassword123",
-                    "name": "Test User"
-                }
-            )
-        
-        # Registration should succeed or fail gracefully
-        assert response.status_code in [201, 500]  # 500 if DB not connected
+        assert response.status_code == 201
+        assert response.json()["user"]["email"] == "new-user@example.com"
+        assert await fake_db.users.find_one({"email": "new-user@example.com"}) is not None
     
     @pytest.mark.asyncio
-    async def test_register_duplicate_email(self, mock_db):
+    async def test_register_duplicate_email(self, client: AsyncClient):
         """Test registration with existing email fails"""
-        mock_db.return_value.find_one = AsyncMock(
-            return_value={"email": "test@example.com"}
+        # test@example.com is seeded into the fake database
+        response = await client.post(
+            "/auth/register",
+            json={
+                "email": "test@example.com",
+                "password": "securepassword123",
+                "name": "Test User"
+            }
         )
         
-        from main import app
-        
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/auth/register",
-                json={
-                    "email": "test@example.com",
-                    "password": "securepassword123",
-                    "name": "Test User"
-                }
-            )
-        
-        assert response.status_code in [400, 500]
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
     
     @pytest.mark.asyncio
-    async def test_register_invalid_email(self):
+    async def test_register_invalid_email(self, client: AsyncClient):
         """Test registration with invalid email fails"""
-        from main import app
-        
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/auth/register",
-                json={
-                    "email": "invalid-email",
-                    "password": "securepassword123",
-                    "name": "Test User"
-                }
-            )
+        response = await client.post(
+            "/auth/register",
+            json={
+                "email": "invalid-email",
+                "password": "securepassword123",
+                "name": "Test User"
+            }
+        )
         
         assert response.status_code == 422  # Validation error
     
     @pytest.mark.asyncio
-    async def test_register_short_password(self):
+    async def test_register_short_password(self, client: AsyncClient):
         """Test registration with short password fails"""
-        from main import app
-        
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/auth/register",
-                json={
-                    "email": "test@example.com",
-                    "password": "short",
-                    "name": "Test User"
-                }
-            )
+        response = await client.post(
+            "/auth/register",
+            json={
+                "email": "test@example.com",
+                "password": "short",
+                "name": "Test User"
+            }
+        )
         
         assert response.status_code == 422  # Validation error
 
@@ -142,23 +90,17 @@ class TestLogin:
     """Tests for user login"""
     
     @pytest.mark.asyncio
-    async def test_login_invalid_credentials(self):
+    async def test_login_invalid_credentials(self, client: AsyncClient):
         """Test login with invalid credentials fails"""
-        from main import app
-        
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/auth/login",
-                data={
-                    "username": "nonexistent@example.com",
-                    "password": "wrongpassword"
-                }
-            )
-        
-        assert response.status_code in [401, 500]
+        response = await client.post(
+            "/auth/login",
+            data={
+                "username": "nonexistent@example.com",
+                "password": "wrongpassword"
+            }
+        )
+        
+        assert response.status_code == 401
 
 
 class TestTokenValidation:
@@ -198,6 +140,71 @@ class TestTokenValidation:
         token_data = decode_token("invalid-token")
         
         assert token_data is None
+    
+    def test_decode_tampered_payload(self, mock_settings):
+        """Test a payload swapped under the original signature is rejected"""
+        from app.utils.auth import decode_token
+        
+        claims = {"sub": "123", "role": "user", "exp": int(time.time()) + 600}
+        header, _payload, signature = _token(claims, mock_settings.jwt_secret_key).split(".")
+        
+        tampered = _b64url(json.dumps({**claims, "role": "admin"}).encode())
+        
+        assert decode_token(f"{header}.{tampered}.{signature}") is None
+    
+    def test_decode_wrong_secret(self):
+        """Test a token signed with another secret is rejected"""
+        from app.utils.auth import decode_token
+        
+        token = _token({"sub": "123", "exp": int(time.time()) + 600}, "some-other-secret")
+        
+        assert decode_token(token) is None
+    
+    def test_decode_alg_none(self):
+        """Test an unsigned token with alg none is rejected"""
+        from app.utils.auth import decode_token
+        
+        header = _b64url(json.dumps({"alg": "none", "typ": "JWT"}).encode())
+        payload = _b64url(json.dumps({"sub": "123", "exp": int(time.time()) + 600}).encode())
+        
+        assert decode_token(f"{header}.{payload}.") is None
+    
+    def test_decode_other_algorithm(self, mock_settings):
+        """Test a correctly signed HS512 token is rejected when HS256 is configured"""
+        from app.utils.auth import decode_token
+        
+        token = _token(
+            {"sub": "123", "exp": int(time.time()) + 600},
+            mock_settings.jwt_secret_key,
+            algorithm="HS512"
+        )
+        
+        assert decode_token(token) is None
+    
+    def test_decode_expired_token(self, mock_settings):
+        """Test a token past its exp is rejected"""
+        from app.utils.auth import decode_token
+        
+        token = _token({"sub": "123", "exp": int(time.time()) - 60}, mock_settings.jwt_secret_key)
+        
+        assert decode_token(token) is None
+    
+    def test_decode_not_yet_valid_token(self, mock_settings):
+        """Test a token with a future nbf is rejected"""
+        from app.utils.auth import decode_token
+        
+        now = int(time.time())
+        token = _token({"sub": "123", "nbf": now + 600, "exp": now + 1200}, mock_settings.jwt_secret_key)
+        
+        assert decode_token(token) is None
+    
+    def test_decode_token_without_subject(self, mock_settings):
+        """Test a validly signed token with no sub is rejected"""
+        from app.utils.auth import decode_token
+        
+        token = _token({"email": "test@example.com", "exp": int(time.time()) + 600}, mock_settings.jwt_secret_key)
+        
+        assert decode_token(token) is None
 
 
 class TestPasswordHashing:
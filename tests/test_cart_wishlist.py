@@ -2,18 +2,80 @@
 Tests for Cart and Wishlist Routes
 """
 
+import asyncio
 import pytest
 from httpx import AsyncClient
 
 
-class TestCartRoutes:
-    """Test cart endpoints"""
+# Product id that never exists in the test database
+FAKE_OID = "507f1f77bcf86cd799439099"
+
+# Independent requests that are checked together, as (method, url, json body)
+AUTH_REQUIRED_CASES = [
+    ("GET", "/cart/", None),
+    ("GET", "/wishlist/", None),
+]
+
+NOT_FOUND_CASES = [
+    ("POST", "/cart/add", {"product_id": FAKE_OID, "size": "2-6", "quantity": 1}),
+    ("PUT", f"/cart/update/{FAKE_OID}/2-6", {"quantity": 2}),
+    ("POST", f"/wishlist/add/{FAKE_OID}", None),
+]
+
+# Handler detail for each NOT_FOUND_CASES url; a routing 404 says "Not Found"
+NOT_FOUND_DETAILS = {
+    "/cart/add": "Product not found",
+    f"/cart/update/{FAKE_OID}/2-6": "Item not found in cart",
+    f"/wishlist/add/{FAKE_OID}": "Product not found",
+}
+
+# (method, url, expected status, expected message) for authenticated requests
+STATUS_CASES = [
+    pytest.param("DELETE", f"/cart/remove/{FAKE_OID}/2-6", 200, "Item removed from cart", id="remove_from_cart"),
+    pytest.param("DELETE", "/cart/clear", 200, "Cart cleared", id="clear_cart"),
+    pytest.param("DELETE", f"/wishlist/remove/{FAKE_OID}", 200, "Product removed from wishlist", id="remove_from_wishlist"),
+    pytest.param("DELETE", "/wishlist/clear", 200, "Wishlist cleared", id="clear_wishlist"),
+]
+
+
+async def _request_all(client: AsyncClient, cases: list, headers: dict = None) -> dict:
+    """Send independent requests concurrently and map each URL to its (status, detail)"""
+    responses = await asyncio.gather(*(
+        client.request(method, url, json=json_body, headers=headers)
+        for method, url, json_body in cases
+    ))
+    return {
+        url: (response.status_code, response.json().get("detail"))
+        for (_, url, _), response in zip(cases, responses)
+    }
+
+
+class TestCartWishlistStatus:
+    """Status code checks for cart and wishlist endpoints"""
+    
+    @pytest.mark.asyncio
+    async def test_all_require_auth(self, client: AsyncClient):
+        """Test cart and wishlist endpoints require authentication"""
+        results = await _request_all(client, AUTH_REQUIRED_CASES)
+        assert results == {url: (401, "Not authenticated") for _, url, _ in AUTH_REQUIRED_CASES}
     
     @pytest.mark.asyncio
-    async def test_get_cart_requires_auth(self, client: AsyncClient):
-        """Test that getting cart requires authentication"""
-        response = await client.get("/cart/")
-        assert response.status_code == 401
+    async def test_all_product_not_found(self, client: AsyncClient, auth_headers: dict):
+        """Test adding or updating non-existent products returns 404"""
+        results = await _request_all(client, NOT_FOUND_CASES, auth_headers)
+        assert results == {url: (404, detail) for url, detail in NOT_FOUND_DETAILS.items()}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,url,expected,message", STATUS_CASES)
+    async def test_endpoint_status(self, client: AsyncClient, auth_headers: dict, method, url, expected, message):
+        """Test endpoint returns the expected status code from its handler"""
+        response = await client.request(method, url, headers=auth_headers)
+        assert response.status_code == expected
+        assert response.json()["message"] == message
+
+
+class TestCartRoutes:
+    """Test cart endpoints"""
     
     @pytest.mark.asyncio
     async def test_get_cart(self, client: AsyncClient, auth_headers: dict):
@@ -26,45 +88,6 @@ class TestCartRoutes:
         assert "subtotal" in data
         assert "item_count" in data
     
-    @pytest.mark.asyncio
-    async def test_add_to_cart_product_not_found(self, client: AsyncClient, auth_headers: dict):
-        """Test adding non-existent product to cart"""
-        response = await client.post(
-            "/cart/add",
-            json={
-                "product_id": "507f1f77bcf86cd799439099",
-                "size": "2-6",
-                "quantity": 1
-            },
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-    
-    @pytest.mark.asyncio
-    async def test_update_cart_item_not_found(self, client: AsyncClient, auth_headers: dict):
-        """Test updating non-existent cart item"""
-        response = await client.put(
-            "/cart/update/507f1f77bcf86cd799439099/2-6",
-            json={"quantity": 2},
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-    
-    @pytest.mark.asyncio
-    async def test_remove_from_cart(self, client: AsyncClient, auth_headers: dict):
-        """Test removing item from cart"""
-        response = await client.delete(
-            "/cart/remove/507f1f77bcf86cd799439099/2-6",
-            headers=auth_headers
-        )
-        assert response.status_code == 200
-    
-    @pytest.mark.asyncio
-    async def test_clear_cart(self, client: AsyncClient, auth_headers: dict):
-        """Test clearing cart"""
-        response = await client.delete("/cart/clear", headers=auth_headers)
-        assert response.status_code == 200
-    
     @pytest.mark.asyncio
     async def test_get_cart_count(self, client: AsyncClient, auth_headers: dict):
         """Test getting cart count"""
@@ -78,12 +101,6 @@ class TestCartRoutes:
 class TestWishlistRoutes:
     """Test wishlist endpoints"""
     
-    @pytest.mark.asyncio
-    async def test_get_wishlist_requires_auth(self, client: AsyncClient):
-        """Test that getting wishlist requires authentication"""
-        response = await client.get("/wishlist/")
-        assert response.status_code == 401
-    
     @pytest.mark.asyncio
     async def test_get_wishlist(self, client: AsyncClient, auth_headers: dict):
         """Test getting user's wishlist"""
@@ -91,35 +108,11 @@ class TestWishlistRoutes:
         assert response.status_code == 200
         assert isinstance(response.json(), list)
     
-    @pytest.mark.asyncio
-    async def test_add_to_wishlist_product_not_found(self, client: AsyncClient, auth_headers: dict):
-        """Test adding non-existent product to wishlist"""
-        response = await client.post(
-            "/wishlist/add/507f1f77bcf86cd799439099",
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-    
-    @pytest.mark.asyncio
-    async def test_remove_from_wishlist(self, client: AsyncClient, auth_headers: dict):
-        """Test removing from wishlist"""
-        response = await client.delete(
-            "/wishlist/remove/507f1f77bcf86cd799439099",
-            headers=auth_headers
-        )
-        assert response.status_code == 200
-    
-    @pytest.mark.asyncio
-    async def test_clear_wishlist(self, client: AsyncClient, auth_headers: dict):
-        """Test clearing wishlist"""
-        response = await client.delete("/wishlist/clear", headers=auth_headers)
-        assert response.status_code == 200
-    
     @pytest.mark.asyncio
     async def test_check_in_wishlist(self, client: AsyncClient, auth_headers: dict):
         """Test checking if product is in wishlist"""
         response = await client.get(
-            "/wishlist/check/507f1f77bcf86cd799439099",
+            f"/wishlist/check/{FAKE_OID}",
             headers=auth_headers
         )
         assert response.status_code == 200
@@ -4,7 +4,19 @@ Tests for Payment Routes
 
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch, MagicMock
+
+# Read-only; deepcopy it in a test that needs to modify it
+_WEBHOOK_PAYLOAD = {
+    "event": "payment.captured",
+    "payload": {
+        "payment": {
+            "entity": {
+                "id": "pay_123",
+                "notes": {"order_id": "ORD-12345678"}
+            }
+        }
+    }
+}
 
 
 class TestPaymentRoutes:
@@ -44,18 +56,7 @@ class TestPaymentRoutes:
     @pytest.mark.asyncio
     async def test_payment_webhook(self, client: AsyncClient):
         """Test Razorpay webhook handler"""
-        payload = {
-            "event": "payment.captured",
-            "payload": {
-                "payment": {
-                    "entity": {
-                        "id": "pay_123",
-                        "notes": {"order_id": "ORD-12345678"}
-                    }
-                }
-            }
-        }
-        response = await client.post("/payment/webhook", json=payload)
+        response = await client.post("/payment/webhook", json=_WEBHOOK_PAYLOAD)
         assert response.status_code == 200
         assert response.json()["status"] == "ok"
     
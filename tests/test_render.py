@@ -3,43 +3,28 @@ Render Pipeline Tests
 Tests for 3D model processing and render job management
 """
 
-import pytest
-from unittest.mock import patch, AsyncMock
 from datetime import datetime
-import sys
-import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.schemas.render import (
+    RenderJobResponse, OutputFilesResponse, ARConfigResponse,
+    ModelUploadResponse, ValidationResult
+)
+from app.models.render_job import RenderJobDocument
+from app.models.product import ARConfigModel
 
+_NOW = datetime(2024, 1, 1)
 
-@pytest.fixture(autouse=True)
-def mock_settings():
-    """Mock settings for tests"""
-    with patch('app.config.get_settings') as mock:
-        mock.return_value = type('Settings', (), {
-            'mongodb_uri': 'mongodb://localhost:27017',
-            'database_name': 'test_megaartsstore',
-            'jwt_secret_key': 'test-secret-key',
-            'jwt_algorithm': 'HS256',
-            'access_token_expire_minutes': 30,
-            'cloudinary_cloud_name': 'test',
-            'cloudinary_api_key': 'test',
-            'cloudinary_api_secret': 'test',
-            'blender_enabled': False,
-            'blender_path': '',
-            'debug': True,
-            'cors_origins': ['http://localhost:3000']
-        })()
-        yield mock
+VALID_STATUSES = frozenset({
+    "pending", "validating", "cleaning", "optimizing",
+    "rendering", "exporting", "completed", "failed",
+})
 
 
 class TestRenderJobSchemas:
     """Tests for render job schemas"""
     
     def test_render_job_response_schema(self):
-        """Test RenderJobResponse schema"""
-        from app.schemas.render import RenderJobResponse, OutputFilesResponse
-        
+        """Test a valid RenderJobResponse passes validation"""
         response = RenderJobResponse(
             id="123",
             job_id="abc-def-123",
@@ -47,18 +32,17 @@ class TestRenderJobSchemas:
             status="pending",
             progress=0,
             input_file="https://example.com/model.glb",
-            output_files=OutputFilesResponse(),
+            output_files={"glb": "https://example.com/model.glb"},
             logs=[],
-            created_at=datetime.utcnow()
+            created_at=_NOW
         )
         
         assert response.status == "pending"
         assert response.progress == 0
+        assert response.output_files == OutputFilesResponse(glb="https://example.com/model.glb")
     
     def test_ar_config_response_schema(self):
-        """Test ARConfigResponse schema"""
-        from app.schemas.render import ARConfigResponse
-        
+        """Test a valid ARConfigResponse passes validation"""
         config = ARConfigResponse(
             model_url="https://example.com/model.glb",
             scale=1.0,
@@ -73,9 +57,7 @@ class TestRenderJobSchemas:
         assert config.wrist_diameter == 6.5
     
     def test_model_upload_response_schema(self):
-        """Test ModelUploadResponse schema"""
-        from app.schemas.render import ModelUploadResponse
-        
+        """Test a valid ModelUploadResponse passes validation"""
         response = ModelUploadResponse(
             success=True,
             file_url="https://example.com/model.glb",
@@ -94,8 +76,6 @@ class TestRenderJobDocument:
     
     def test_create_render_job_document(self):
         """Test RenderJobDocument creation"""
-        from app.models.render_job import RenderJobDocument
-        
         doc = RenderJobDocument.create_document(
             product_id="product123",
             input_file="https://example.com/model.glb"
@@ -108,37 +88,35 @@ class TestRenderJobDocument:
         assert len(doc["job_id"]) > 0  # UUID generated
     
     def test_render_job_output_files_structure(self):
-        """Test output files structure"""
-        from app.models.render_job import RenderJobDocument
-        
+        """Test a new job's output files map to empty API slots"""
         doc = RenderJobDocument.create_document(
             product_id="product123",
             input_file="https://example.com/model.glb"
         )
         
-        output_files = doc["output_files"]
+        # Outputs are filled in as the pipeline runs
+        assert doc["output_files"] == {}
         
-        assert "glb" in output_files
-        assert "preview_front" in output_files
-        assert "preview_angle" in output_files
-        assert "preview_detail" in output_files
-        assert "turntable" in output_files
+        output_files = OutputFilesResponse(**doc["output_files"])
+        assert output_files.model_dump() == dict.fromkeys(
+            ["glb", "preview_front", "preview_angle", "preview_detail", "turntable"]
+        )
 
 
 class TestARConfiguration:
     """Tests for AR configuration"""
     
     def test_ar_configuration_model(self):
-        """Test ARConfiguration model"""
-        from app.models.render_job import ARConfiguration
+        """Test ARConfigModel defaults and values"""
+        default = ARConfigModel()
+        assert default.scale == 1.0
+        assert default.rotation == [0, 0, 0]
         
-        config = ARConfiguration(
-            model_url="https://example.com/model.glb",
+        config = ARConfigModel(
             scale=1.5,
             rotation=[0, 90, 0],
             offset=[0, 0.1, 0],
-            wrist_diameter=6.5,
-            bangle_thickness=0.8
+            wrist_diameter=6.5
         )
         
         assert config.scale == 1.5
@@ -150,9 +128,7 @@ class TestValidationResult:
     """Tests for model validation result"""
     
     def test_validation_result_schema(self):
-        """Test ValidationResult schema"""
-        from app.schemas.render import ValidationResult
-        
+        """Test a valid ValidationResult passes validation"""
         result = ValidationResult(
             valid=True,
             polygon_count=50000,
@@ -169,8 +145,6 @@ class TestValidationResult:
     
     def test_validation_result_with_issues(self):
         """Test ValidationResult with issues"""
-        from app.schemas.render import ValidationResult
-        
         result = ValidationResult(
             valid=False,
             polygon_count=150000,
@@ -187,34 +161,18 @@ class TestValidationResult:
 class TestJobService:
     """Tests for job service functions"""
     
-    @pytest.mark.asyncio
-    async def test_job_status_transitions(self):
-        """Test valid job status transitions"""
-        valid_statuses = ["pending", "validating", "cleaning", "optimizing", 
-                         "rendering", "exporting", "completed", "failed"]
-        
-        for status in valid_statuses:
-            assert status in valid_statuses
-    
-    def test_job_progress_range(self):
-        """Test job progress is within valid range"""
-        from app.models.render_job import RenderJobInDB
-        from pydantic import ValidationError
-        
-        # Valid progress
-        job = RenderJobInDB(
-            job_id="test-123",
-            product_id="product123",
-            input_file="https://example.com/model.glb",
-            progress=50
-        )
-        assert job.progress == 50
-        
-        # Progress should be 0-100
-        with pytest.raises(ValidationError):
-            RenderJobInDB(
-                job_id="test-123",
-                product_id="product123",
-                input_file="https://example.com/model.glb",
-                progress=150  # Invalid
-            )
+    def test_job_status_transitions(self):
+        """Test the display label of every job status"""
+        labels = {s: RenderJobDocument.get_status_display(s) for s in VALID_STATUSES}
+        
+        assert labels == {
+            "pending": "Pending",
+            "validating": "Validating Model",
+            "cleaning": "Cleaning Geometry",
+            "optimizing": "Optimizing Mesh",
+            "rendering": "Generating Renders",
+            "exporting": "Exporting Files",
+            "completed": "Completed",
+            "failed": "Failed",
+        }
+        assert RenderJobDocument.create_document("p", "f")["status"] in VALID_STATUSES